@@ -2,8 +2,12 @@
 """Generate and serve a review page for eval results.
 
 Reads the workspace directory, discovers runs (directories with outputs/),
-embeds all output data into a self-contained HTML page, and serves it via
-a tiny HTTP server. Feedback auto-saves to feedback.json in the workspace.
+and serves a review page via a tiny HTTP server. The server keeps an index
+of runs that only rebuilds run directories whose files changed, hands run
+data to the page in pages through /api/runs, and streams output files from
+/files/ with ETag revalidation. --static instead embeds everything into one
+self-contained HTML file. Feedback auto-saves to feedback.json in the
+workspace.
 
 Usage:
     python generate_review.py <workspace-path> [--port PORT] [--skill-name NAME]
@@ -18,14 +22,17 @@ import json
 import mimetypes
 import os
 import re
+import shutil
 import signal
 import subprocess
 import sys
+import threading
 import time
 import webbrowser
 from functools import partial
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from urllib.parse import parse_qs, quote, unquote, urlsplit
 
 # Files to exclude from output listings
 METADATA_FILES = {"transcript.md", "user_notes.md", "metrics.json"}
@@ -40,6 +47,19 @@ TEXT_EXTENSIONS = {
 # Extensions we render as inline images
 IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp"}
 
+# Text outputs up to this size are sent inline with run data; larger ones
+# are fetched from /files/ by the page when shown.
+TEXT_INLINE_LIMIT = 256 * 1024
+
+# Runs per /api/runs page
+RUNS_PAGE_SIZE = 50
+
+# Minimum seconds between workspace rescans by the live run index
+INDEX_REFRESH_INTERVAL = 1.0
+
+# Directories never descended into when looking for runs
+SKIP_DIRS = {"node_modules", ".git", "__pycache__", "skill", "inputs"}
+
 # MIME type overrides for common types
 MIME_OVERRIDES = {
     ".svg": "image/svg+xml",
@@ -57,33 +77,62 @@ def get_mime_type(path: Path) -> str:
     return mime or "application/octet-stream"
 
 
+def _sort_key(run: dict) -> tuple:
+    eval_id = run.get("eval_id")
+    return (float("inf") if eval_id is None else eval_id, run["id"])
+
+
 def find_runs(workspace: Path) -> list[dict]:
     """Recursively find directories that contain an outputs/ subdirectory."""
     runs: list[dict] = []
-    _find_runs_recursive(workspace, workspace, runs)
-    runs.sort(key=lambda r: (r.get("eval_id", float("inf")), r["id"]))
+    for run_dir in find_run_dirs(workspace):
+        run = build_run(workspace, run_dir)
+        if run:
+            runs.append(run)
+    runs.sort(key=_sort_key)
     return runs
 
 
-def _find_runs_recursive(root: Path, current: Path, runs: list[dict]) -> None:
+def find_run_dirs(workspace: Path) -> list[Path]:
+    run_dirs: list[Path] = []
+    _find_run_dirs_recursive(workspace, run_dirs)
+    return run_dirs
+
+
+def _find_run_dirs_recursive(current: Path, run_dirs: list[Path]) -> None:
     if not current.is_dir():
         return
 
     outputs_dir = current / "outputs"
     if outputs_dir.is_dir():
-        run = build_run(root, current)
-        if run:
-            runs.append(run)
+        run_dirs.append(current)
         return
 
-    skip = {"node_modules", ".git", "__pycache__", "skill", "inputs"}
     for child in sorted(current.iterdir()):
-        if child.is_dir() and child.name not in skip:
-            _find_runs_recursive(root, child, runs)
+        if child.is_dir() and child.name not in SKIP_DIRS:
+            _find_run_dirs_recursive(child, run_dirs)
+
 
+def run_id_for(root: Path, run_dir: Path) -> str:
+    return str(run_dir.relative_to(root)).replace("/", "-").replace("\\", "-")
 
-def build_run(root: Path, run_dir: Path) -> dict | None:
-    """Build a run dict with prompt, outputs, and grading data."""
+
+def list_output_files(run_dir: Path) -> list[Path]:
+    outputs_dir = run_dir / "outputs"
+    if not outputs_dir.is_dir():
+        return []
+    return [
+        f for f in sorted(outputs_dir.iterdir())
+        if f.is_file() and f.name not in METADATA_FILES
+    ]
+
+
+def build_run(root: Path, run_dir: Path, files_url: str | None = None) -> dict | None:
+    """Build a run dict with prompt, outputs, and grading data.
+
+    Output files are embedded inline unless files_url is given, in which case
+    each is described by link_file() with a URL under files_url/<run_id>/.
+    """
     prompt = ""
     eval_id = None
 
@@ -116,15 +165,15 @@ def build_run(root: Path, run_dir: Path) -> dict | None:
     if not prompt:
         prompt = "(No prompt found)"
 
-    run_id = str(run_dir.relative_to(root)).replace("/", "-").replace("\\", "-")
+    run_id = run_id_for(root, run_dir)
 
     # Collect output files
-    outputs_dir = run_dir / "outputs"
     output_files: list[dict] = []
-    if outputs_dir.is_dir():
-        for f in sorted(outputs_dir.iterdir()):
-            if f.is_file() and f.name not in METADATA_FILES:
-                output_files.append(embed_file(f))
+    for f in list_output_files(run_dir):
+        if files_url is None:
+            output_files.append(embed_file(f))
+        else:
+            output_files.append(link_file(f, f"{files_url}/{quote(run_id, safe='')}/{quote(f.name, safe='')}"))
 
     # Load grading if present
     grading = None
@@ -210,26 +259,154 @@ def embed_file(path: Path) -> dict:
         }
 
 
+def file_kind(path: Path) -> str:
+    ext = path.suffix.lower()
+    if ext in TEXT_EXTENSIONS:
+        return "text"
+    if ext in IMAGE_EXTENSIONS:
+        return "image"
+    if ext == ".pdf":
+        return "pdf"
+    if ext == ".xlsx":
+        return "xlsx"
+    return "binary"
+
+
+def link_file(path: Path, url: str) -> dict:
+    """Describe a file by URL instead of embedding it; small text stays inline."""
+    kind = file_kind(path)
+    try:
+        size = path.stat().st_size
+    except OSError:
+        return {"name": path.name, "type": "error", "content": "(Error reading file)"}
+    entry = {
+        "name": path.name,
+        "type": kind,
+        "mime": get_mime_type(path),
+        "size": size,
+        "url": url,
+    }
+    if kind == "text" and size <= TEXT_INLINE_LIMIT:
+        try:
+            entry["content"] = path.read_text(errors="replace")
+        except OSError:
+            entry["content"] = "(Error reading file)"
+    return entry
+
+
+def _run_signature(run_dir: Path) -> tuple:
+    """Cheap stat-based fingerprint of everything build_run reads for run_dir."""
+    watched = [
+        run_dir,
+        run_dir / "outputs",
+        run_dir / "eval_metadata.json",
+        run_dir.parent / "eval_metadata.json",
+        run_dir / "transcript.md",
+        run_dir / "outputs" / "transcript.md",
+        run_dir / "grading.json",
+        run_dir.parent / "grading.json",
+        *list_output_files(run_dir),
+    ]
+    signature = []
+    for path in watched:
+        try:
+            st = path.stat()
+            signature.append((str(path), st.st_mtime_ns, st.st_size))
+        except OSError:
+            signature.append((str(path), None, None))
+    return tuple(signature)
+
+
+class RunIndex:
+    """Live index of a workspace's runs, rebuilt per run directory only when it changes.
+
+    Each run is cached with a stat signature of the files build_run reads;
+    refresh() rescans the workspace (at most every INDEX_REFRESH_INTERVAL
+    seconds) and rebuilds only runs whose signature moved. Output files are
+    linked under files_url rather than embedded.
+    """
+
+    def __init__(self, workspace: Path, files_url: str):
+        self.workspace = workspace
+        self.files_url = files_url
+        self._cache: dict[Path, tuple[tuple, dict | None]] = {}
+        self._runs: list[dict] = []
+        self._run_dirs: dict[str, Path] = {}
+        self._refreshed_at = 0.0
+        self._lock = threading.Lock()
+
+    def refresh(self, force: bool = False) -> list[dict]:
+        with self._lock:
+            now = time.monotonic()
+            if not force and self._refreshed_at and now - self._refreshed_at < INDEX_REFRESH_INTERVAL:
+                return self._runs
+            cache: dict[Path, tuple[tuple, dict | None]] = {}
+            for run_dir in find_run_dirs(self.workspace):
+                signature = _run_signature(run_dir)
+                cached = self._cache.get(run_dir)
+                if cached and cached[0] == signature:
+                    cache[run_dir] = cached
+                else:
+                    cache[run_dir] = (signature, build_run(self.workspace, run_dir, self.files_url))
+            self._cache = cache
+            runs = [run for _, run in cache.values() if run]
+            runs.sort(key=_sort_key)
+            self._runs = runs
+            self._run_dirs = {run_id_for(self.workspace, d): d for d, (_, run) in cache.items() if run}
+            self._refreshed_at = now
+            return runs
+
+    def output_path(self, run_id: str, name: str) -> Path | None:
+        """Resolve a listed output file of a known run, or None."""
+        self.refresh()
+        run_dir = self._run_dirs.get(run_id)
+        if run_dir is None:
+            return None
+        for f in list_output_files(run_dir):
+            if f.name == name:
+                return f
+        return None
+
+
+# Handler threads serialize feedback saves through this lock
+_feedback_lock = threading.Lock()
+
+
+def save_feedback(feedback_path: Path, data: dict) -> None:
+    """Write feedback.json atomically; overlapping saves land one at a time."""
+    with _feedback_lock:
+        tmp_path = feedback_path.with_name(feedback_path.name + ".tmp")
+        try:
+            tmp_path.write_text(json.dumps(data, indent=2) + "\n")
+            os.replace(tmp_path, feedback_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+
+def load_previous_feedback(workspace: Path) -> dict[str, str]:
+    """Load previous iteration's non-empty feedback as run_id -> feedback."""
+    feedback_path = workspace / "feedback.json"
+    if not feedback_path.exists():
+        return {}
+    try:
+        data = json.loads(feedback_path.read_text())
+        return {
+            r["run_id"]: r["feedback"]
+            for r in data.get("reviews", [])
+            if r.get("feedback", "").strip()
+        }
+    except (json.JSONDecodeError, OSError, KeyError):
+        return {}
+
+
 def load_previous_iteration(workspace: Path) -> dict[str, dict]:
     """Load previous iteration's feedback and outputs.
 
     Returns a map of run_id -> {"feedback": str, "outputs": list[dict]}.
     """
     result: dict[str, dict] = {}
-
-    # Load feedback
-    feedback_map: dict[str, str] = {}
-    feedback_path = workspace / "feedback.json"
-    if feedback_path.exists():
-        try:
-            data = json.loads(feedback_path.read_text())
-            feedback_map = {
-                r["run_id"]: r["feedback"]
-                for r in data.get("reviews", [])
-                if r.get("feedback", "").strip()
-            }
-        except (json.JSONDecodeError, OSError, KeyError):
-            pass
+    feedback_map = load_previous_feedback(workspace)
 
     # Load runs (to get outputs)
     prev_runs = find_runs(workspace)
@@ -281,6 +458,31 @@ def generate_html(
     return template.replace("/*__EMBEDDED_DATA__*/", f"const EMBEDDED_DATA = {data_json};")
 
 
+def generate_lazy_html(
+    skill_name: str,
+    previous_feedback: dict[str, str],
+    has_previous_outputs: bool,
+    benchmark: dict | None = None,
+) -> str:
+    """Generate the served page shell; run data is fetched from /api/runs."""
+    template_path = Path(__file__).parent / "viewer.html"
+    template = template_path.read_text()
+
+    embedded = {
+        "skill_name": skill_name,
+        "lazy": True,
+        "page_size": RUNS_PAGE_SIZE,
+        "previous_feedback": previous_feedback,
+        "has_previous_outputs": has_previous_outputs,
+    }
+    if benchmark:
+        embedded["benchmark"] = benchmark
+
+    data_json = json.dumps(embedded)
+
+    return template.replace("/*__EMBEDDED_DATA__*/", f"const EMBEDDED_DATA = {data_json};")
+
+
 # ---------------------------------------------------------------------------
 # HTTP server (stdlib only, zero dependencies)
 # ---------------------------------------------------------------------------
@@ -306,47 +508,70 @@ def _kill_port(port: int) -> None:
         print("Note: lsof not found, cannot check if port is in use", file=sys.stderr)
 
 class ReviewHandler(BaseHTTPRequestHandler):
-    """Serves the review HTML and handles feedback saves.
+    """Serves the review page, paged run data, output files, and feedback saves.
 
-    Regenerates the HTML on each page load so that refreshing the browser
-    picks up new eval outputs without restarting the server.
+    Run data comes from a RunIndex that is refreshed on request, so
+    refreshing the browser picks up new eval outputs without restarting the
+    server while only re-reading run directories that changed.
     """
 
     def __init__(
         self,
-        workspace: Path,
+        run_index: RunIndex,
         skill_name: str,
         feedback_path: Path,
-        previous: dict[str, dict],
+        previous_index: RunIndex | None,
+        previous_feedback: dict[str, str],
         benchmark_path: Path | None,
         *args,
         **kwargs,
     ):
-        self.workspace = workspace
+        self.run_index = run_index
         self.skill_name = skill_name
         self.feedback_path = feedback_path
-        self.previous = previous
+        self.previous_index = previous_index
+        self.previous_feedback = previous_feedback
         self.benchmark_path = benchmark_path
         super().__init__(*args, **kwargs)
 
     def do_GET(self) -> None:
-        if self.path == "/" or self.path == "/index.html":
-            # Regenerate HTML on each request (re-scans workspace for new outputs)
-            runs = find_runs(self.workspace)
+        url = urlsplit(self.path)
+        path = url.path
+        if path == "/" or path == "/index.html":
             benchmark = None
             if self.benchmark_path and self.benchmark_path.exists():
                 try:
                     benchmark = json.loads(self.benchmark_path.read_text())
                 except (json.JSONDecodeError, OSError):
                     pass
-            html = generate_html(runs, self.skill_name, self.previous, benchmark)
+            html = generate_lazy_html(
+                self.skill_name,
+                self.previous_feedback,
+                self.previous_index is not None,
+                benchmark,
+            )
             content = html.encode("utf-8")
             self.send_response(200)
             self.send_header("Content-Type", "text/html; charset=utf-8")
             self.send_header("Content-Length", str(len(content)))
             self.end_headers()
             self.wfile.write(content)
-        elif self.path == "/api/feedback":
+        elif path == "/api/runs":
+            self._send_runs_page(parse_qs(url.query))
+        elif path.startswith("/files/"):
+            parts = path.split("/")
+            # /files/<current|previous>/<run_id>/<name>
+            if len(parts) != 5:
+                self.send_error(404)
+                return
+            _, _, scope, run_id, name = parts
+            index = self.run_index if scope == "current" else self.previous_index if scope == "previous" else None
+            file_path = index.output_path(unquote(run_id), unquote(name)) if index else None
+            if file_path is None:
+                self.send_error(404)
+                return
+            self._send_file(file_path)
+        elif path == "/api/feedback":
             data = b"{}"
             if self.feedback_path.exists():
                 data = self.feedback_path.read_bytes()
@@ -358,6 +583,64 @@ class ReviewHandler(BaseHTTPRequestHandler):
         else:
             self.send_error(404)
 
+    def _send_runs_page(self, query: dict[str, list[str]]) -> None:
+        try:
+            offset = max(0, int(query.get("offset", ["0"])[0]))
+            limit = min(500, max(1, int(query.get("limit", [str(RUNS_PAGE_SIZE)])[0])))
+        except ValueError:
+            self.send_error(400)
+            return
+        runs = self.run_index.refresh()
+        page = runs[offset:offset + limit]
+        if self.previous_index is not None:
+            previous = {r["id"]: r for r in self.previous_index.refresh()}
+            page = [
+                {**run, "previous_outputs": previous.get(run["id"], {}).get("outputs", [])}
+                for run in page
+            ]
+        body = json.dumps({
+            "total": len(runs),
+            "offset": offset,
+            "ids": [r["id"] for r in runs],
+            "runs": page,
+        }).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_file(self, path: Path) -> None:
+        try:
+            st = path.stat()
+        except OSError:
+            self.send_error(404)
+            return
+        etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+        if_none_match = self.headers.get("If-None-Match", "")
+        if etag in [tag.strip() for tag in if_none_match.split(",")]:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        try:
+            f = open(path, "rb")
+        except OSError:
+            self.send_error(404)
+            return
+        with f:
+            self.send_response(200)
+            self.send_header("Content-Type", get_mime_type(path))
+            self.send_header("Content-Length", str(st.st_size))
+            self.send_header("ETag", etag)
+            # Always revalidate; the ETag makes that a cheap 304
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            try:
+                shutil.copyfileobj(f, self.wfile)
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
     def do_POST(self) -> None:
         if self.path == "/api/feedback":
             length = int(self.headers.get("Content-Length", 0))
@@ -366,7 +649,7 @@ class ReviewHandler(BaseHTTPRequestHandler):
                 data = json.loads(body)
                 if not isinstance(data, dict) or "reviews" not in data:
                     raise ValueError("Expected JSON object with 'reviews' key")
-                self.feedback_path.write_text(json.dumps(data, indent=2) + "\n")
+                save_feedback(self.feedback_path, data)
                 resp = b'{"ok":true}'
                 self.send_response(200)
             except (json.JSONDecodeError, OSError, ValueError) as e:
@@ -408,42 +691,54 @@ def main() -> None:
         print(f"Error: {workspace} is not a directory", file=sys.stderr)
         sys.exit(1)
 
-    runs = find_runs(workspace)
-    if not runs:
-        print(f"No runs found in {workspace}", file=sys.stderr)
-        sys.exit(1)
-
     skill_name = args.skill_name or workspace.name.replace("-workspace", "")
     feedback_path = workspace / "feedback.json"
-
-    previous: dict[str, dict] = {}
-    if args.previous_workspace:
-        previous = load_previous_iteration(args.previous_workspace.resolve())
-
     benchmark_path = args.benchmark.resolve() if args.benchmark else None
-    benchmark = None
-    if benchmark_path and benchmark_path.exists():
-        try:
-            benchmark = json.loads(benchmark_path.read_text())
-        except (json.JSONDecodeError, OSError):
-            pass
 
     if args.static:
+        runs = find_runs(workspace)
+        if not runs:
+            print(f"No runs found in {workspace}", file=sys.stderr)
+            sys.exit(1)
+        previous: dict[str, dict] = {}
+        if args.previous_workspace:
+            previous = load_previous_iteration(args.previous_workspace.resolve())
+        benchmark = None
+        if benchmark_path and benchmark_path.exists():
+            try:
+                benchmark = json.loads(benchmark_path.read_text())
+            except (json.JSONDecodeError, OSError):
+                pass
         html = generate_html(runs, skill_name, previous, benchmark)
         args.static.parent.mkdir(parents=True, exist_ok=True)
         args.static.write_text(html)
         print(f"\n  Static viewer written to: {args.static}\n")
         sys.exit(0)
 
+    run_index = RunIndex(workspace, "/files/current")
+    if not run_index.refresh(force=True):
+        print(f"No runs found in {workspace}", file=sys.stderr)
+        sys.exit(1)
+
+    previous_index = None
+    previous_feedback: dict[str, str] = {}
+    if args.previous_workspace:
+        previous_workspace = args.previous_workspace.resolve()
+        previous_index = RunIndex(previous_workspace, "/files/previous")
+        previous_feedback = load_previous_feedback(previous_workspace)
+
     # Kill any existing process on the target port
     port = args.port
     _kill_port(port)
-    handler = partial(ReviewHandler, workspace, skill_name, feedback_path, previous, benchmark_path)
+    handler = partial(
+        ReviewHandler, run_index, skill_name, feedback_path,
+        previous_index, previous_feedback, benchmark_path,
+    )
     try:
-        server = HTTPServer(("127.0.0.1", port), handler)
+        server = ThreadingHTTPServer(("127.0.0.1", port), handler)
     except OSError:
         # Port still in use after kill attempt — find a free one
-        server = HTTPServer(("127.0.0.1", 0), handler)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
         port = server.server_address[1]
 
     url = f"http://localhost:{port}"
@@ -452,8 +747,8 @@ def main() -> None:
     print(f"  URL:       {url}")
     print(f"  Workspace: {workspace}")
     print(f"  Feedback:  {feedback_path}")
-    if previous:
-        print(f"  Previous:  {args.previous_workspace} ({len(previous)} runs)")
+    if previous_index:
+        print(f"  Previous:  {args.previous_workspace} ({len(previous_index.refresh())} runs)")
     if benchmark_path:
         print(f"  Benchmark: {benchmark_path}")
     print(f"\n  Press Ctrl+C to stop.\n")
@@ -4,7 +4,16 @@ Aggregate individual run results into benchmark summary statistics.
 
 Reads grading.json files from run directories and produces:
 - run_summary with mean, stddev, min, max for each metric
-- delta between with_skill and without_skill configurations
+- delta between with_skill and without_skill configurations, with bootstrap
+  confidence intervals
+- per_eval_summary with the same statistics per eval and configuration
+
+Run files are parsed in parallel, and parsed results are cached in
+<benchmark_dir>/.benchmark_manifest.json keyed by file mtime and size, so
+re-aggregating after a new batch only parses new or changed runs. Summary
+statistics use numpy when it is installed and fall back to pure Python
+otherwise; bootstrap intervals are always computed in pure Python so
+benchmark.json does not depend on whether numpy is present.
 
 Usage:
     python aggregate_benchmark.py <benchmark_dir>
@@ -37,10 +46,25 @@ The script supports two directory layouts:
 import argparse
 import json
 import math
+import os
+import random
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError:  # Pure-Python fallback below
+    np = None
+
+MANIFEST_NAME = ".benchmark_manifest.json"
+# Bump when the parsed run result format changes so old manifests are ignored
+MANIFEST_VERSION = 1
+
+BOOTSTRAP_SAMPLES = 2000
+CONFIDENCE_LEVEL = 0.95
+
 
 def calculate_stats(values: list[float]) -> dict:
     """Calculate mean, stddev, min, max for a list of values."""
@@ -48,28 +72,176 @@ def calculate_stats(values: list[float]) -> dict:
         return {"mean": 0.0, "stddev": 0.0, "min": 0.0, "max": 0.0}
 
     n = len(values)
-    mean = sum(values) / n
-
-    if n > 1:
-        variance = sum((x - mean) ** 2 for x in values) / (n - 1)
-        stddev = math.sqrt(variance)
+    if np is not None:
+        arr = np.asarray(values, dtype=float)
+        mean = float(arr.mean())
+        stddev = float(arr.std(ddof=1)) if n > 1 else 0.0
+        low, high = float(arr.min()), float(arr.max())
     else:
-        stddev = 0.0
+        mean = sum(values) / n
+        if n > 1:
+            variance = sum((x - mean) ** 2 for x in values) / (n - 1)
+            stddev = math.sqrt(variance)
+        else:
+            stddev = 0.0
+        low, high = min(values), max(values)
 
     return {
         "mean": round(mean, 4),
         "stddev": round(stddev, 4),
-        "min": round(min(values), 4),
-        "max": round(max(values), 4)
+        "min": round(low, 4),
+        "max": round(high, 4)
     }
 
 
-def load_run_results(benchmark_dir: Path) -> dict:
+def bootstrap_delta_ci(
+    primary: list[float],
+    baseline: list[float],
+    samples: int = BOOTSTRAP_SAMPLES,
+    level: float = CONFIDENCE_LEVEL,
+    seed: int = 0,
+) -> list[float] | None:
+    """
+    Percentile bootstrap CI for mean(primary) - mean(baseline).
+
+    Runs are resampled with replacement within each configuration from a
+    seeded random.Random, so the same inputs always give the same interval.
+    This stays pure Python even when numpy is installed: numpy's generator
+    draws a different stream, and the resampling is cheap at benchmark sizes.
+    Returns [low, high], or None if either side has no runs.
+    """
+    if not primary or not baseline:
+        return None
+    alpha = (1 - level) / 2
+
+    rng = random.Random(seed)
+    deltas = sorted(
+        sum(rng.choices(primary, k=len(primary))) / len(primary)
+        - sum(rng.choices(baseline, k=len(baseline))) / len(baseline)
+        for _ in range(samples)
+    )
+    low = deltas[int(alpha * (samples - 1))]
+    high = deltas[int((1 - alpha) * (samples - 1))]
+    return [round(low, 4), round(high, 4)]
+
+
+def _file_signature(path: Path) -> list | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _run_signature(run_dir: Path) -> list:
+    return [_file_signature(run_dir / "grading.json"), _file_signature(run_dir / "timing.json")]
+
+
+def load_run(run_dir: Path) -> dict | None:
+    """
+    Parse one run directory's grading.json (and timing.json fallback).
+
+    Returns the run's metrics without eval_id, or None if grading.json is
+    missing or invalid.
+    """
+    run_number = int(run_dir.name.split("-")[1])
+    grading_file = run_dir / "grading.json"
+
+    if not grading_file.exists():
+        print(f"Warning: grading.json not found in {run_dir}")
+        return None
+
+    try:
+        with open(grading_file) as f:
+            grading = json.load(f)
+    except json.JSONDecodeError as e:
+        print(f"Warning: Invalid JSON in {grading_file}: {e}")
+        return None
+
+    # Extract metrics
+    result = {
+        "run_number": run_number,
+        "pass_rate": grading.get("summary", {}).get("pass_rate", 0.0),
+        "passed": grading.get("summary", {}).get("passed", 0),
+        "failed": grading.get("summary", {}).get("failed", 0),
+        "total": grading.get("summary", {}).get("total", 0),
+    }
+
+    # Extract timing — check grading.json first, then sibling timing.json
+    timing = grading.get("timing", {})
+    result["time_seconds"] = timing.get("total_duration_seconds", 0.0)
+    timing_file = run_dir / "timing.json"
+    if result["time_seconds"] == 0.0 and timing_file.exists():
+        try:
+            with open(timing_file) as tf:
+                timing_data = json.load(tf)
+            result["time_seconds"] = timing_data.get("total_duration_seconds", 0.0)
+            result["tokens"] = timing_data.get("total_tokens", 0)
+        except json.JSONDecodeError:
+            pass
+
+    # Extract metrics if available
+    metrics = grading.get("execution_metrics", {})
+    result["tool_calls"] = metrics.get("total_tool_calls", 0)
+    if not result.get("tokens"):
+        result["tokens"] = metrics.get("output_chars", 0)
+    result["errors"] = metrics.get("errors_encountered", 0)
+
+    # Extract expectations — viewer requires fields: text, passed, evidence
+    raw_expectations = grading.get("expectations", [])
+    for exp in raw_expectations:
+        if "text" not in exp or "passed" not in exp:
+            print(f"Warning: expectation in {grading_file} missing required fields (text, passed, evidence): {exp}")
+    result["expectations"] = raw_expectations
+
+    # Extract notes from user_notes_summary
+    notes_summary = grading.get("user_notes_summary", {})
+    notes = []
+    notes.extend(notes_summary.get("uncertainties", []))
+    notes.extend(notes_summary.get("needs_review", []))
+    notes.extend(notes_summary.get("workarounds", []))
+    result["notes"] = notes
+
+    return result
+
+
+def _read_manifest(manifest_path: Path) -> dict:
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest.get("runs", {})
+
+
+def _write_manifest(manifest_path: Path, runs: dict) -> None:
+    # Write-then-rename so an interrupted run never leaves a truncated manifest
+    tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump({"version": MANIFEST_VERSION, "runs": runs}, f)
+        os.replace(tmp_path, manifest_path)
+    except OSError as e:
+        print(f"Warning: could not write manifest {manifest_path}: {e}")
+
+
+def load_run_results(
+    benchmark_dir: Path,
+    workers: int | None = None,
+    use_manifest: bool = True,
+) -> dict:
     """
     Load all run results from a benchmark directory.
 
     Returns dict keyed by config name (e.g. "with_skill"/"without_skill",
     or "new_skill"/"old_skill"), each containing a list of run results.
+
+    Run directories whose grading.json/timing.json mtime and size match the
+    manifest reuse the cached parse; the rest are parsed on a pool of
+    `workers` threads and the manifest is updated. Runs that fail to parse
+    are never cached, so their warning repeats until they are fixed.
     """
     # Support both layouts: eval dirs directly under benchmark_dir, or under runs/
     runs_dir = benchmark_dir / "runs"
@@ -81,8 +253,8 @@ def load_run_results(benchmark_dir: Path) -> dict:
         print(f"No eval directories found in {benchmark_dir} or {benchmark_dir / 'runs'}")
         return {}
 
-    results: dict[str, list] = {}
-
+    # Discover runs in a stable order: (eval_id, config, run_dir)
+    discovered: list[tuple[object, str, Path]] = []
     for eval_idx, eval_dir in enumerate(sorted(search_dir.glob("eval-*"))):
         metadata_path = eval_dir / "eval_metadata.json"
         if metadata_path.exists():
@@ -102,73 +274,51 @@ def load_run_results(benchmark_dir: Path) -> dict:
             if not config_dir.is_dir():
                 continue
             # Skip non-config directories (inputs, outputs, etc.)
-            if not list(config_dir.glob("run-*")):
+            run_dirs = sorted(config_dir.glob("run-*"))
+            if not run_dirs:
                 continue
-            config = config_dir.name
-            if config not in results:
-                results[config] = []
-
-            for run_dir in sorted(config_dir.glob("run-*")):
-                run_number = int(run_dir.name.split("-")[1])
-                grading_file = run_dir / "grading.json"
-
-                if not grading_file.exists():
-                    print(f"Warning: grading.json not found in {run_dir}")
-                    continue
-
-                try:
-                    with open(grading_file) as f:
-                        grading = json.load(f)
-                except json.JSONDecodeError as e:
-                    print(f"Warning: Invalid JSON in {grading_file}: {e}")
-                    continue
-
-                # Extract metrics
-                result = {
-                    "eval_id": eval_id,
-                    "run_number": run_number,
-                    "pass_rate": grading.get("summary", {}).get("pass_rate", 0.0),
-                    "passed": grading.get("summary", {}).get("passed", 0),
-                    "failed": grading.get("summary", {}).get("failed", 0),
-                    "total": grading.get("summary", {}).get("total", 0),
-                }
-
-                # Extract timing — check grading.json first, then sibling timing.json
-                timing = grading.get("timing", {})
-                result["time_seconds"] = timing.get("total_duration_seconds", 0.0)
-                timing_file = run_dir / "timing.json"
-                if result["time_seconds"] == 0.0 and timing_file.exists():
-                    try:
-                        with open(timing_file) as tf:
-                            timing_data = json.load(tf)
-                        result["time_seconds"] = timing_data.get("total_duration_seconds", 0.0)
-                        result["tokens"] = timing_data.get("total_tokens", 0)
-                    except json.JSONDecodeError:
-                        pass
-
-                # Extract metrics if available
-                metrics = grading.get("execution_metrics", {})
-                result["tool_calls"] = metrics.get("total_tool_calls", 0)
-                if not result.get("tokens"):
-                    result["tokens"] = metrics.get("output_chars", 0)
-                result["errors"] = metrics.get("errors_encountered", 0)
-
-                # Extract expectations — viewer requires fields: text, passed, evidence
-                raw_expectations = grading.get("expectations", [])
-                for exp in raw_expectations:
-                    if "text" not in exp or "passed" not in exp:
-                        print(f"Warning: expectation in {grading_file} missing required fields (text, passed, evidence): {exp}")
-                result["expectations"] = raw_expectations
-
-                # Extract notes from user_notes_summary
-                notes_summary = grading.get("user_notes_summary", {})
-                notes = []
-                notes.extend(notes_summary.get("uncertainties", []))
-                notes.extend(notes_summary.get("needs_review", []))
-                notes.extend(notes_summary.get("workarounds", []))
-                result["notes"] = notes
-
-                results[config].append(result)
+            for run_dir in run_dirs:
+                discovered.append((eval_id, config_dir.name, run_dir))
+
+    manifest_path = benchmark_dir / MANIFEST_NAME
+    cached_runs = _read_manifest(manifest_path) if use_manifest else {}
+    manifest_runs: dict[str, dict] = {}
+    parsed: dict[Path, dict | None] = {}
+    # Signatures are taken before parsing, so a file rewritten mid-parse is
+    # re-parsed next time instead of caching the old result under its new stat
+    to_parse: list[tuple[Path, list]] = []
+
+    for _, _, run_dir in discovered:
+        key = str(run_dir.relative_to(benchmark_dir))
+        signature = _run_signature(run_dir)
+        entry = cached_runs.get(key)
+        if entry and entry.get("signature") == signature and entry.get("result") is not None:
+            parsed[run_dir] = entry.get("result")
+            manifest_runs[key] = entry
+        else:
+            to_parse.append((run_dir, signature))
+
+    if to_parse:
+        run_dirs = [run_dir for run_dir, _ in to_parse]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for (run_dir, signature), result in zip(to_parse, executor.map(load_run, run_dirs)):
+                parsed[run_dir] = result
+                # Failed parses stay out of the manifest so they are retried
+                # (and warned about) on every run until fixed
+                if result is not None:
+                    key = str(run_dir.relative_to(benchmark_dir))
+                    manifest_runs[key] = {"signature": signature, "result": result}
+
+    if use_manifest and manifest_runs != cached_runs:
+        _write_manifest(manifest_path, manifest_runs)
+
+    results: dict[str, list] = {}
+    for eval_id, config, run_dir in discovered:
+        results.setdefault(config, [])
+        result = parsed.get(run_dir)
+        if result is None:
+            continue
+        results[config].append({"eval_id": eval_id, **result})
 
     return results
 
@@ -207,9 +357,12 @@ def aggregate_results(results: dict) -> dict:
     if len(configs) >= 2:
         primary = run_summary.get(configs[0], {})
         baseline = run_summary.get(configs[1], {})
+        primary_runs = results.get(configs[0], [])
+        baseline_runs = results.get(configs[1], [])
     else:
         primary = run_summary.get(configs[0], {}) if configs else {}
         baseline = {}
+        primary_runs = baseline_runs = []
 
     delta_pass_rate = primary.get("pass_rate", {}).get("mean", 0) - baseline.get("pass_rate", {}).get("mean", 0)
     delta_time = primary.get("time_seconds", {}).get("mean", 0) - baseline.get("time_seconds", {}).get("mean", 0)
@@ -221,14 +374,62 @@ def aggregate_results(results: dict) -> dict:
         "tokens": f"{delta_tokens:+.0f}"
     }
 
+    # Bootstrap CIs for the delta; extra key, so viewers reading the
+    # string fields above are unaffected
+    if primary_runs and baseline_runs:
+        run_summary["delta"]["ci"] = {
+            "level": CONFIDENCE_LEVEL,
+            "pass_rate": bootstrap_delta_ci(
+                [r["pass_rate"] for r in primary_runs], [r["pass_rate"] for r in baseline_runs]
+            ),
+            "time_seconds": bootstrap_delta_ci(
+                [r["time_seconds"] for r in primary_runs], [r["time_seconds"] for r in baseline_runs]
+            ),
+            "tokens": bootstrap_delta_ci(
+                [r.get("tokens", 0) for r in primary_runs], [r.get("tokens", 0) for r in baseline_runs]
+            ),
+        }
+
     return run_summary
 
 
-def generate_benchmark(benchmark_dir: Path, skill_name: str = "", skill_path: str = "") -> dict:
+def aggregate_per_eval(results: dict) -> dict:
+    """
+    Aggregate run results per eval and configuration.
+
+    Returns {eval_id: {config: {pass_rate, time_seconds, tokens}}}, with
+    eval_id as a string so the result round-trips through JSON unchanged.
+    """
+    grouped: dict[str, dict[str, list]] = {}
+    for config, runs in results.items():
+        for r in runs:
+            grouped.setdefault(str(r["eval_id"]), {}).setdefault(config, []).append(r)
+
+    per_eval = {}
+    for eval_id, configs in grouped.items():
+        per_eval[eval_id] = {
+            config: {
+                "runs": len(runs),
+                "pass_rate": calculate_stats([r["pass_rate"] for r in runs]),
+                "time_seconds": calculate_stats([r["time_seconds"] for r in runs]),
+                "tokens": calculate_stats([r.get("tokens", 0) for r in runs]),
+            }
+            for config, runs in configs.items()
+        }
+    return per_eval
+
+
+def generate_benchmark(
+    benchmark_dir: Path,
+    skill_name: str = "",
+    skill_path: str = "",
+    workers: int | None = None,
+    use_manifest: bool = True,
+) -> dict:
     """
     Generate complete benchmark.json from run results.
     """
-    results = load_run_results(benchmark_dir)
+    results = load_run_results(benchmark_dir, workers=workers, use_manifest=use_manifest)
     run_summary = aggregate_results(results)
 
     # Build runs array for benchmark.json
@@ -272,6 +473,7 @@ def generate_benchmark(benchmark_dir: Path, skill_name: str = "", skill_path: st
         },
         "runs": runs,
         "run_summary": run_summary,
+        "per_eval_summary": aggregate_per_eval(results),
         "notes": []  # To be filled by analyzer
     }
 
@@ -306,21 +508,34 @@ def generate_markdown(benchmark: dict) -> str:
     a_summary = run_summary.get(config_a, {})
     b_summary = run_summary.get(config_b, {})
     delta = run_summary.get("delta", {})
+    ci = delta.get("ci", {})
+
+    def fmt_ci(metric: str, fmt: str) -> str:
+        bounds = ci.get(metric)
+        if not bounds:
+            return ""
+        return f" [{bounds[0]:{fmt}}, {bounds[1]:{fmt}}]"
 
     # Format pass rate
     a_pr = a_summary.get("pass_rate", {})
     b_pr = b_summary.get("pass_rate", {})
-    lines.append(f"| Pass Rate | {a_pr.get('mean', 0)*100:.0f}% ± {a_pr.get('stddev', 0)*100:.0f}% | {b_pr.get('mean', 0)*100:.0f}% ± {b_pr.get('stddev', 0)*100:.0f}% | {delta.get('pass_rate', '—')} |")
+    lines.append(f"| Pass Rate | {a_pr.get('mean', 0)*100:.0f}% ± {a_pr.get('stddev', 0)*100:.0f}% | {b_pr.get('mean', 0)*100:.0f}% ± {b_pr.get('stddev', 0)*100:.0f}% | {delta.get('pass_rate', '—')}{fmt_ci('pass_rate', '+.2f')} |")
 
     # Format time
     a_time = a_summary.get("time_seconds", {})
     b_time = b_summary.get("time_seconds", {})
-    lines.append(f"| Time | {a_time.get('mean', 0):.1f}s ± {a_time.get('stddev', 0):.1f}s | {b_time.get('mean', 0):.1f}s ± {b_time.get('stddev', 0):.1f}s | {delta.get('time_seconds', '—')}s |")
+    lines.append(f"| Time | {a_time.get('mean', 0):.1f}s ± {a_time.get('stddev', 0):.1f}s | {b_time.get('mean', 0):.1f}s ± {b_time.get('stddev', 0):.1f}s | {delta.get('time_seconds', '—')}s{fmt_ci('time_seconds', '+.1f')} |")
 
     # Format tokens
     a_tokens = a_summary.get("tokens", {})
     b_tokens = b_summary.get("tokens", {})
-    lines.append(f"| Tokens | {a_tokens.get('mean', 0):.0f} ± {a_tokens.get('stddev', 0):.0f} | {b_tokens.get('mean', 0):.0f} ± {b_tokens.get('stddev', 0):.0f} | {delta.get('tokens', '—')} |")
+    lines.append(f"| Tokens | {a_tokens.get('mean', 0):.0f} ± {a_tokens.get('stddev', 0):.0f} | {b_tokens.get('mean', 0):.0f} ± {b_tokens.get('stddev', 0):.0f} | {delta.get('tokens', '—')}{fmt_ci('tokens', '+.0f')} |")
+
+    if ci:
+        lines.extend([
+            "",
+            f"Delta brackets are {ci.get('level', CONFIDENCE_LEVEL):.0%} bootstrap confidence intervals.",
+        ])
 
     # Notes section
     if benchmark.get("notes"):
@@ -360,6 +575,18 @@ def main():
         help="Output path for benchmark.json (default: <benchmark_dir>/benchmark.json)"
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Threads used to parse run files (default: Python's ThreadPoolExecutor default)"
+    )
+    parser.add_argument(
+        "--no-manifest",
+        action="store_true",
+        help=f"Ignore and don't update the {MANIFEST_NAME} parse cache"
+    )
+
     args = parser.parse_args()
 
     if not args.benchmark_dir.exists():
@@ -367,7 +594,13 @@ def main():
         sys.exit(1)
 
     # Generate benchmark
-    benchmark = generate_benchmark(args.benchmark_dir, args.skill_name, args.skill_path)
+    benchmark = generate_benchmark(
+        args.benchmark_dir,
+        args.skill_name,
+        args.skill_path,
+        workers=args.workers,
+        use_manifest=not args.no_manifest,
+    )
 
     # Determine output paths
     output_json = args.output or (args.benchmark_dir / "benchmark.json")
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""Measure trigger-eval harness overhead against a fake `claude` executable.
+
+Drives run_eval against a stand-in `claude` that replays a configurable
+stream-json shape with configurable latency, so harness throughput (spawn,
+parsing, scheduling, kill) can be measured offline and compared across
+changes. Nothing here talks to a model.
+
+Every scenario is deterministic: whether a query triggers, hangs or emits
+filler is decided by hashing the query with --seed, and each scenario is
+repeated --repeat times with the median wall time reported.
+
+Usage:
+    python -m scripts.benchmark_harness --scenario stream --scenario timeouts
+    python -m scripts.benchmark_harness --output bench.json
+    python -m scripts.benchmark_harness --baseline bench.json --tolerance 0.2
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from scripts.generate_report import format_latency
+from scripts.probe_roots import ProbeRootPool
+from scripts.run_eval import run_eval_async
+
+# Fake `claude -p`. Reads its scenario from FAKE_CLAUDE_CONFIG and the query
+# from argv. It cannot know which probe command is "its" one, so a triggering
+# run names every probe in .claude/commands -- the real CLI sees them all too.
+FAKE_CLAUDE = r'''
+import hashlib, json, os, sys, time
+config = json.loads(os.environ["FAKE_CLAUDE_CONFIG"])
+query = sys.argv[sys.argv.index("-p") + 1]
+digest = hashlib.sha256(f"{config['seed']}:{query}".encode()).digest()
+def draw(i):
+    return digest[i] / 255
+def emit(event):
+    sys.stdout.write(json.dumps(event) + "\n")
+    sys.stdout.flush()
+def pause(seconds):
+    jitter = config["jitter"]
+    time.sleep(max(0.0, seconds * (1 + jitter * (2 * draw(3) - 1))))
+
+pause(config["startup"])
+if draw(1) < config["hang_rate"]:
+    time.sleep(3600)
+emit({"type": "system", "subtype": "init"})
+for _ in range(config["filler_events"]):
+    emit({"type": "system", "subtype": "filler", "data": "x" * config["filler_bytes"]})
+pause(config["decision_delay"])
+
+triggered = draw(0) < config["trigger_rate"]
+commands = os.path.join(os.getcwd(), ".claude", "commands")
+names = sorted(n[:-3] for n in os.listdir(commands) if n.endswith(".md")) if os.path.isdir(commands) else []
+skill_input = {"skill": " ".join(names)}
+if config["shape"] == "stream":
+    if triggered:
+        emit({"type": "stream_event", "event": {"type": "content_block_start", "content_block": {"type": "tool_use", "name": "Skill"}}})
+        payload = json.dumps(skill_input)
+        for i in range(0, len(payload), 16):
+            emit({"type": "stream_event", "event": {"type": "content_block_delta", "delta": {"type": "input_json_delta", "partial_json": payload[i:i + 16]}}})
+        emit({"type": "stream_event", "event": {"type": "content_block_stop"}})
+    else:
+        emit({"type": "stream_event", "event": {"type": "content_block_start", "content_block": {"type": "text"}}})
+        emit({"type": "stream_event", "event": {"type": "message_stop"}})
+else:
+    content = [{"type": "tool_use", "name": "Skill", "input": skill_input}] if triggered else [{"type": "text", "text": "no"}]
+    emit({"type": "assistant", "message": {"content": content}})
+pause(config["tail"])
+emit({"type": "result"})
+'''
+
+DEFAULT_CONFIG = {
+    "shape": "stream",
+    "startup": 0.05,
+    "decision_delay": 0.05,
+    "tail": 0.0,
+    "jitter": 0.2,
+    "trigger_rate": 0.5,
+    "hang_rate": 0.0,
+    "filler_events": 0,
+    "filler_bytes": 0,
+}
+
+SCENARIOS = {
+    # Early decision from partial-message stream events
+    "stream": {},
+    # No stream events; decision waits for the full assistant message
+    "assistant-fallback": {"shape": "assistant"},
+    # The child keeps running after the decision and has to be killed
+    "slow-kill": {"tail": 5.0},
+    # A slice of runs never answer and hit the per-query timeout
+    "timeouts": {"hang_rate": 0.2},
+    # Large stream-json lines ahead of the decision stress line parsing
+    "large-lines": {"filler_events": 20, "filler_bytes": 256 * 1024},
+}
+
+
+def _make_sandbox(root: Path) -> tuple[Path, Path]:
+    """Create a fake `claude` on a bin dir and a project root with .claude/."""
+    bin_dir = root / "bin"
+    bin_dir.mkdir()
+    fake = bin_dir / "claude"
+    fake.write_text(f"#!{sys.executable}\n{FAKE_CLAUDE}")
+    fake.chmod(0o755)
+    project_root = root / "project"
+    (project_root / ".claude" / "commands").mkdir(parents=True)
+    return bin_dir, project_root
+
+
+def _eval_set(num_queries: int) -> list[dict]:
+    return [
+        {"query": f"benchmark query {i}", "should_trigger": i % 2 == 0}
+        for i in range(num_queries)
+    ]
+
+
+async def _run_scenario(
+    config: dict,
+    project_root: Path,
+    num_queries: int,
+    runs_per_query: int,
+    num_workers: int,
+    timeout: int,
+    probe_pool: ProbeRootPool | None,
+) -> tuple[float, dict]:
+    os.environ["FAKE_CLAUDE_CONFIG"] = json.dumps(config)
+    t0 = time.perf_counter()
+    output = await run_eval_async(
+        eval_set=_eval_set(num_queries),
+        skill_name="bench",
+        description="Benchmark skill used to measure harness overhead.",
+        num_workers=num_workers,
+        timeout=timeout,
+        project_root=project_root,
+        runs_per_query=runs_per_query,
+        probe_pool=probe_pool,
+    )
+    return time.perf_counter() - t0, output["summary"]["latency"]
+
+
+def run_benchmark(
+    scenarios: list[str],
+    num_queries: int,
+    runs_per_query: int,
+    num_workers: int,
+    timeout: int,
+    repeat: int,
+    seed: int,
+    isolate: bool = False,
+) -> dict:
+    """Run each scenario repeat times and report median throughput and overhead.
+
+    ideal_wall_s is the wall time a harness with zero overhead would need:
+    the fake's configured time-to-decision for every run, spread across
+    num_workers (hung runs count as the full timeout). The overhead therefore
+    includes the fake's own interpreter startup, so compare reports taken on
+    the same machine rather than reading it as an absolute cost.
+
+    With isolate, runs use a ProbeRootPool (created outside the timed
+    region, as run_eval.py --isolate pre-warms it) instead of the shared
+    .claude/commands directory.
+    """
+    tmp = Path(tempfile.mkdtemp(prefix="skill-bench-"))
+    saved_path = os.environ.get("PATH", "")
+    saved_config = os.environ.get("FAKE_CLAUDE_CONFIG")
+    probe_pool = None
+    try:
+        bin_dir, project_root = _make_sandbox(tmp)
+        if isolate:
+            probe_pool = ProbeRootPool(num_workers, mirror_root=project_root, base_dir=tmp)
+        os.environ["PATH"] = f"{bin_dir}{os.pathsep}{saved_path}"
+        results = {}
+        for name in scenarios:
+            config = {**DEFAULT_CONFIG, **SCENARIOS[name], "seed": seed}
+            walls = []
+            latency: dict = {}
+            for _ in range(repeat):
+                wall, latency = asyncio.run(_run_scenario(
+                    config, project_root, num_queries, runs_per_query, num_workers, timeout,
+                    probe_pool,
+                ))
+                walls.append(wall)
+            runs = num_queries * runs_per_query
+            wall = statistics.median(walls)
+            per_run = config["startup"] + config["decision_delay"]
+            hung = latency.get("timeouts", 0)
+            ideal = ((runs - hung) * per_run + hung * timeout) / num_workers
+            results[name] = {
+                "config": config,
+                "runs": runs,
+                "wall_s": round(wall, 4),
+                "wall_s_all": [round(w, 4) for w in walls],
+                "runs_per_s": round(runs / wall, 2),
+                "ideal_wall_s": round(ideal, 4),
+                "overhead_s": round(wall - ideal, 4),
+                "overhead_per_run_ms": round((wall - ideal) * num_workers / runs * 1000, 2),
+                "latency": latency,
+            }
+        return {
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+            "num_queries": num_queries,
+            "runs_per_query": runs_per_query,
+            "num_workers": num_workers,
+            "timeout": timeout,
+            "repeat": repeat,
+            "seed": seed,
+            "isolate": isolate,
+            "scenarios": results,
+        }
+    finally:
+        if probe_pool is not None:
+            probe_pool.close()
+        os.environ["PATH"] = saved_path
+        if saved_config is None:
+            os.environ.pop("FAKE_CLAUDE_CONFIG", None)
+        else:
+            os.environ["FAKE_CLAUDE_CONFIG"] = saved_config
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def compare_to_baseline(current: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Return a message for each scenario whose throughput fell more than tolerance."""
+    regressions = []
+    for name, result in current["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if not before:
+            continue
+        floor = before["runs_per_s"] * (1 - tolerance)
+        if result["runs_per_s"] < floor:
+            regressions.append(
+                f"{name}: {result['runs_per_s']} runs/s vs baseline {before['runs_per_s']} "
+                f"(allowed down to {floor:.2f})"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark trigger-eval harness overhead against a fake claude")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="Scenario to run (repeatable; default: all)")
+    parser.add_argument("--queries", type=int, default=20, help="Queries per scenario")
+    parser.add_argument("--runs-per-query", type=int, default=3, help="Runs per query")
+    parser.add_argument("--num-workers", type=int, default=10, help="Number of parallel workers")
+    parser.add_argument("--timeout", type=int, default=2, help="Per-query timeout in seconds")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per scenario (median is reported)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the fake's per-query behaviour")
+    parser.add_argument("--isolate", action="store_true", help="Run queries in pooled isolated project roots (run_eval.py --isolate)")
+    parser.add_argument("--output", default=None, help="Write the JSON report here (default: stdout)")
+    parser.add_argument("--baseline", default=None, help="Earlier JSON report to compare throughput against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed fractional throughput drop vs --baseline")
+    args = parser.parse_args()
+
+    report = run_benchmark(
+        scenarios=args.scenario or list(SCENARIOS),
+        num_queries=args.queries,
+        runs_per_query=args.runs_per_query,
+        num_workers=args.num_workers,
+        timeout=args.timeout,
+        repeat=args.repeat,
+        seed=args.seed,
+        isolate=args.isolate,
+    )
+
+    for name, result in report["scenarios"].items():
+        latency = result["latency"]
+        print(
+            f"{name:20s} {result['runs_per_s']:8.2f} runs/s  wall {result['wall_s']:.2f}s "
+            f"(ideal {result['ideal_wall_s']:.2f}s, +{result['overhead_per_run_ms']:.1f}ms/run)  "
+            f"decision {format_latency(latency)}  kill {format_latency(latency, 'kill')}",
+            file=sys.stderr,
+        )
+
+    json_output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(json_output)
+    else:
+        print(json_output)
+
+    if args.baseline:
+        regressions = compare_to_baseline(report, json.loads(Path(args.baseline).read_text()), args.tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,17 @@ import json
 import sys
 from pathlib import Path
 
+# Percentiles reported for each latency phase (see run_eval.latency_summary)
+LATENCY_PERCENTILES = (50, 95, 99)
+
+
+def format_latency(summary: dict, field: str = "decision") -> str:
+    """One-line "p50/p95/p99" rendering of a latency_summary phase, in seconds."""
+    stats = summary.get(field)
+    if not stats:
+        return "n/a"
+    return "/".join(f"{stats[f'p{pct}']:.2f}" for pct in LATENCY_PERCENTILES) + "s"
+
 
 def generate_html(data: dict, auto_refresh: bool = False, skill_name: str = "") -> str:
     """Generate HTML report from loop output data. If auto_refresh is True, adds a meta refresh tag."""
@@ -29,6 +40,9 @@ def generate_html(data: dict, auto_refresh: bool = False, skill_name: str = "")
             for r in history[0].get("test_results", []):
                 test_queries.append({"query": r["query"], "should_trigger": r.get("should_trigger", True)})
 
+    # Latency columns only for output recorded with per-run timings
+    show_latency = any(h.get("latency") for h in history)
+
     refresh_tag = '    <meta http-equiv="refresh" content="5">\n' if auto_refresh else ""
 
     html_parts = ["""<!DOCTYPE html>
@@ -132,6 +146,9 @@ def generate_html(data: dict, auto_refresh: bool = False, skill_name: str = "")
         .train-label { color: #b0aea5; font-size: 10px; }
         .test-label { color: #6a9bcc; font-size: 10px; font-weight: bold; }
         .best-row { background: #f5f8f2; }
+        .pruned-row { opacity: 0.6; }
+        .skipped { color: #b0aea5; }
+        td.latency { font-family: monospace; font-size: 11px; white-space: nowrap; }
         th.positive-col { border-bottom: 3px solid #788c5d; }
         th.negative-col { border-bottom: 3px solid #c44; }
         th.test-col.positive-col { border-bottom: 3px solid #788c5d; }
@@ -161,7 +178,14 @@ def generate_html(data: dict, auto_refresh: bool = False, skill_name: str = "")
         <p class="best"><strong>Best:</strong> {html.escape(data.get('best_description', 'N/A'))}</p>
         <p><strong>Best Score:</strong> {data.get('best_score', 'N/A')} {'(test)' if best_test_score else '(train)'}</p>
         <p><strong>Iterations:</strong> {data.get('iterations_run', 0)} | <strong>Train:</strong> {data.get('train_size', '?')} | <strong>Test:</strong> {data.get('test_size', '?')}</p>
-    </div>
+""")
+    latency = data.get("latency")
+    if latency:
+        html_parts.append(
+            f"""        <p><strong>Latency p50/p95/p99:</strong> decision {format_latency(latency)} | first event {format_latency(latency, 'first_event')} | spawn {format_latency(latency, 'spawn')} | kill {format_latency(latency, 'kill')} | {latency.get('runs', 0)} runs, {latency.get('timeouts', 0)} timeouts</p>
+"""
+        )
+    html_parts.append("""    </div>
 """)
 
     # Legend
@@ -184,7 +208,10 @@ def generate_html(data: dict, auto_refresh: bool = False, skill_name: str = "")
                 <th>Iter</th>
                 <th>Train</th>
                 <th>Test</th>
-                <th class="query-col">Description</th>
+""")
+    if show_latency:
+        html_parts.append('                <th title="Time to trigger decision, p50/p95/p99">Decision</th>\n')
+    html_parts.append("""                <th class="query-col">Description</th>
 """)
 
     # Add column headers for train queries
@@ -202,22 +229,27 @@ def generate_html(data: dict, auto_refresh: bool = False, skill_name: str = "")
         <tbody>
 """)
 
-    # Find best iteration for highlighting
+    # Find best entry for highlighting (pruned search candidates never win)
+    complete = [h for h in history if not h.get("pruned")] or history
     if test_queries:
-        best_iter = max(history, key=lambda h: h.get("test_passed") or 0).get("iteration")
+        best_entry = max(complete, key=lambda h: h.get("test_passed") or 0) if complete else None
     else:
-        best_iter = max(history, key=lambda h: h.get("train_passed", h.get("passed", 0))).get("iteration")
+        best_entry = max(complete, key=lambda h: h.get("train_passed", h.get("passed", 0))) if complete else None
 
     # Add rows for each iteration
     for h in history:
         iteration = h.get("iteration", "?")
+        candidate = h.get("candidate")
+        iter_label = f"{iteration}.{candidate}" if candidate else f"{iteration}"
+        if h.get("pruned"):
+            iter_label += '<span class="rate">pruned</span>'
         train_passed = h.get("train_passed", h.get("passed", 0))
         train_total = h.get("train_total", h.get("total", 0))
         test_passed = h.get("test_passed")
         test_total = h.get("test_total")
         description = h.get("description", "")
         train_results = h.get("train_results", h.get("results", []))
-        test_results = h.get("test_results", [])
+        test_results = h.get("test_results") or []
 
         # Create lookups for results by query
         train_by_query = {r["query"]: r for r in train_results}
@@ -253,18 +285,27 @@ def generate_html(data: dict, auto_refresh: bool = False, skill_name: str = "")
         train_class = score_class(train_correct, train_runs)
         test_class = score_class(test_correct, test_runs)
 
-        row_class = "best-row" if iteration == best_iter else ""
+        row_class = "best-row" if h is best_entry else ("pruned-row" if h.get("pruned") else "")
 
         html_parts.append(f"""            <tr class="{row_class}">
-                <td>{iteration}</td>
+                <td>{iter_label}</td>
                 <td><span class="score {train_class}">{train_correct}/{train_runs}</span></td>
                 <td><span class="score {test_class}">{test_correct}/{test_runs}</span></td>
-                <td class="description">{html.escape(description)}</td>
+""")
+        if show_latency:
+            row_latency = h.get("latency") or {}
+            timeouts = row_latency.get("timeouts", 0)
+            html_parts.append(f'                <td class="latency">{format_latency(row_latency)}<span class="rate">{timeouts} timeouts</span></td>\n')
+        html_parts.append(f"""                <td class="description">{html.escape(description)}</td>
 """)
 
         # Add result for each train query
         for qinfo in train_queries:
-            r = train_by_query.get(qinfo["query"], {})
+            r = train_by_query.get(qinfo["query"])
+            if r is None:
+                # Not evaluated (e.g. candidate pruned after screening)
+                html_parts.append('                <td class="result skipped">\u2013</td>\n')
+                continue
             did_pass = r.get("pass", False)
             triggers = r.get("triggers", 0)
             runs = r.get("runs", 0)
@@ -276,7 +317,10 @@ def generate_html(data: dict, auto_refresh: bool = False, skill_name: str = "")
 
         # Add result for each test query (with different background)
         for qinfo in test_queries:
-            r = test_by_query.get(qinfo["query"], {})
+            r = test_by_query.get(qinfo["query"])
+            if r is None:
+                html_parts.append('                <td class="result test-result skipped">\u2013</td>\n')
+                continue
             did_pass = r.get("pass", False)
             triggers = r.get("triggers", 0)
             runs = r.get("runs", 0)
@@ -56,7 +56,7 @@ def improve_description(
     model: str,
     test_results: dict | None = None,
     log_dir: Path | None = None,
-    iteration: int | None = None,
+    iteration: int | str | None = None,
 ) -> str:
     """Call Claude to improve the description based on eval results."""
     failed_triggers = [
@@ -4,15 +4,29 @@ Skill Packager - Creates a distributable .skill file of a skill folder
 
 Usage:
     python utils/package_skill.py <path/to/skill-folder> [output-directory]
+    python utils/package_skill.py --batch <path/to/skills-tree> [output-directory] [--force] [--jobs N]
 
 Example:
     python utils/package_skill.py skills/public/my-skill
     python utils/package_skill.py skills/public/my-skill ./dist
+    python utils/package_skill.py --batch skills/public ./dist
+
+Archives are reproducible: entries are written in sorted order with a fixed
+timestamp and permissions, so unchanged inputs give byte-identical .skill
+files. Batch mode packages every skill under a tree, validating and
+compressing skills concurrently, and skips skills whose content hash matches
+the last build recorded in <output-directory>/.package_manifest.json.
 """
 
+import argparse
 import fnmatch
+import hashlib
+import json
+import os
+import stat
 import sys
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from scripts.quick_validate import validate_skill
 
@@ -23,6 +37,13 @@ EXCLUDE_FILES = {".DS_Store"}
 # Directories excluded only at the skill root (not when nested deeper).
 ROOT_EXCLUDE_DIRS = {"evals"}
 
+# Fixed entry metadata so archives depend only on file names and contents.
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+FILE_MODE = 0o644
+EXEC_MODE = 0o755
+
+MANIFEST_NAME = ".package_manifest.json"
+
 
 def should_exclude(rel_path: Path) -> bool:
     """Check if a path should be excluded from packaging."""
@@ -39,6 +60,53 @@ def should_exclude(rel_path: Path) -> bool:
     return any(fnmatch.fnmatch(name, pat) for pat in EXCLUDE_GLOBS)
 
 
+def collect_files(skill_path: Path) -> list[tuple[Path, str]]:
+    """Return (file, arcname) pairs to package, sorted by arcname."""
+    files = []
+    for file_path in skill_path.rglob('*'):
+        if not file_path.is_file():
+            continue
+        arcname = file_path.relative_to(skill_path.parent)
+        if should_exclude(arcname):
+            continue
+        files.append((file_path, arcname.as_posix()))
+    files.sort(key=lambda item: item[1])
+    return files
+
+
+def _is_executable(file_path: Path) -> bool:
+    return bool(file_path.stat().st_mode & stat.S_IXUSR)
+
+
+def content_hash(files: list[tuple[Path, str]]) -> str:
+    """Hash of every packaged file's name, exec bit, and bytes."""
+    digest = hashlib.sha256()
+    for file_path, arcname in files:
+        digest.update(arcname.encode("utf-8") + b"\0")
+        digest.update(b"x" if _is_executable(file_path) else b"-")
+        digest.update(hashlib.sha256(file_path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def write_archive(files: list[tuple[Path, str]], skill_filename: Path) -> None:
+    """Write a reproducible zip: sorted entries, fixed timestamps and modes."""
+    # Stage next to the destination so a failed write never leaves a partial .skill
+    tmp_filename = skill_filename.with_name(skill_filename.name + ".tmp")
+    try:
+        with zipfile.ZipFile(tmp_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            for file_path, arcname in files:
+                info = zipfile.ZipInfo(arcname, date_time=ZIP_EPOCH)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                info.create_system = 3  # Unix, so external_attr is honored
+                mode = EXEC_MODE if _is_executable(file_path) else FILE_MODE
+                info.external_attr = (stat.S_IFREG | mode) << 16
+                zipf.writestr(info, file_path.read_bytes())
+        os.replace(tmp_filename, skill_filename)
+    finally:
+        if tmp_filename.exists():
+            tmp_filename.unlink()
+
+
 def package_skill(skill_path, output_dir=None):
     """
     Package a skill folder into a .skill file.
@@ -88,17 +156,10 @@ def package_skill(skill_path, output_dir=None):
 
     # Create the .skill file (zip format)
     try:
-        with zipfile.ZipFile(skill_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Walk through the skill directory, excluding build artifacts
-            for file_path in skill_path.rglob('*'):
-                if not file_path.is_file():
-                    continue
-                arcname = file_path.relative_to(skill_path.parent)
-                if should_exclude(arcname):
-                    print(f"  Skipped: {arcname}")
-                    continue
-                zipf.write(file_path, arcname)
-                print(f"  Added: {arcname}")
+        files = collect_files(skill_path)
+        write_archive(files, skill_filename)
+        for _, arcname in files:
+            print(f"  Added: {arcname}")
 
         print(f"\n✅ Successfully packaged skill to: {skill_filename}")
         return skill_filename
@@ -108,23 +169,145 @@ def package_skill(skill_path, output_dir=None):
         return None
 
 
+def find_skills(root: Path) -> list[Path]:
+    """Find skill folders (directories with a SKILL.md) under root, without nesting."""
+    skills = []
+    for skill_md in sorted(root.rglob("SKILL.md")):
+        skill_dir = skill_md.parent
+        rel = skill_dir.relative_to(root)
+        if any(part in EXCLUDE_DIRS for part in rel.parts):
+            continue
+        if any(parent in skills for parent in skill_dir.parents):
+            continue
+        skills.append(skill_dir)
+    return skills
+
+
+def archive_hash(skill_filename: Path) -> str | None:
+    """SHA-256 of a built .skill file, or None if it does not exist."""
+    try:
+        return hashlib.sha256(skill_filename.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _write_manifest(manifest_path: Path, manifest: dict) -> None:
+    # Write-then-rename so an interrupted build never leaves a truncated manifest
+    tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+    try:
+        tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+        os.replace(tmp_path, manifest_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def _build_one(skill_path: Path, output_path: Path, previous: dict, force: bool) -> dict:
+    name = skill_path.name
+    valid, message = validate_skill(skill_path)
+    if not valid:
+        return {"name": name, "status": "invalid", "message": message}
+
+    files = collect_files(skill_path)
+    digest = content_hash(files)
+    skill_filename = output_path / f"{name}.skill"
+    # The archive itself must also be the one this manifest entry recorded;
+    # a .skill overwritten by single-skill mode or by hand is rebuilt
+    if (
+        not force
+        and previous.get("hash") == digest
+        and previous.get("archive_sha256") is not None
+        and archive_hash(skill_filename) == previous["archive_sha256"]
+    ):
+        return {"name": name, "status": "unchanged", "hash": digest, "archive_sha256": previous["archive_sha256"]}
+
+    write_archive(files, skill_filename)
+    return {
+        "name": name,
+        "status": "built",
+        "hash": digest,
+        "archive_sha256": archive_hash(skill_filename),
+        "files": len(files),
+    }
+
+
+def package_skills(skills_root, output_dir=None, force=False, jobs=None):
+    """
+    Package every skill under skills_root into output_dir.
+
+    Skills are validated, hashed, and compressed concurrently (zlib releases
+    the GIL, so threads compress in parallel). A skill whose content hash
+    matches the manifest from the last build, and whose .skill file is still
+    the archive that build wrote, is skipped. Manifest entries for skills no
+    longer under skills_root are dropped.
+
+    Returns a list of per-skill result dicts with "name" and "status"
+    ("built", "unchanged", "invalid", or "error").
+    """
+    skills_root = Path(skills_root).resolve()
+    output_path = Path(output_dir).resolve() if output_dir else Path.cwd()
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    skills = find_skills(skills_root)
+    names = [skill.name for skill in skills]
+    duplicates = sorted({n for n in names if names.count(n) > 1})
+    if duplicates:
+        print(f"❌ Error: duplicate skill names would collide in {output_path}: {', '.join(duplicates)}")
+        return [{"name": n, "status": "error", "message": "duplicate skill name"} for n in duplicates]
+
+    manifest_path = output_path / MANIFEST_NAME
+    try:
+        manifest = json.loads(manifest_path.read_text())
+    except (OSError, json.JSONDecodeError):
+        manifest = {}
+
+    def build(skill_path: Path) -> dict:
+        try:
+            return _build_one(skill_path, output_path, manifest.get(skill_path.name, {}), force)
+        except Exception as e:
+            return {"name": skill_path.name, "status": "error", "message": str(e)}
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        results = list(executor.map(build, skills))
+
+    manifest = {name: entry for name, entry in manifest.items() if name in names}
+    for result in results:
+        if result["status"] in ("built", "unchanged"):
+            manifest[result["name"]] = {"hash": result["hash"], "archive_sha256": result["archive_sha256"]}
+    _write_manifest(manifest_path, manifest)
+
+    return results
+
+
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python utils/package_skill.py <path/to/skill-folder> [output-directory]")
-        print("\nExample:")
-        print("  python utils/package_skill.py skills/public/my-skill")
-        print("  python utils/package_skill.py skills/public/my-skill ./dist")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description="Package a skill folder (or a tree of skills) into .skill files")
+    parser.add_argument("skill_path", help="Path to the skill folder, or with --batch, a tree of skill folders")
+    parser.add_argument("output_dir", nargs="?", default=None, help="Output directory (default: current directory)")
+    parser.add_argument("--batch", action="store_true", help="Package every skill found under skill_path")
+    parser.add_argument("--force", action="store_true", help="With --batch, rebuild skills even if unchanged")
+    parser.add_argument("--jobs", type=int, default=None, help="With --batch, number of skills processed concurrently")
+    args = parser.parse_args()
 
-    skill_path = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else None
+    if args.batch:
+        print(f"📦 Packaging skills under: {args.skill_path}")
+        results = package_skills(args.skill_path, args.output_dir, force=args.force, jobs=args.jobs)
+        for result in results:
+            if result["status"] == "built":
+                print(f"  ✅ {result['name']} ({result['files']} files)")
+            elif result["status"] == "unchanged":
+                print(f"  ⏭️  {result['name']} (unchanged)")
+            else:
+                print(f"  ❌ {result['name']}: {result['message']}")
+        counts = {status: sum(1 for r in results if r["status"] == status) for status in ("built", "unchanged", "invalid", "error")}
+        print(f"\n{counts['built']} built, {counts['unchanged']} unchanged, {counts['invalid'] + counts['error']} failed")
+        sys.exit(1 if counts["invalid"] or counts["error"] else 0)
 
-    print(f"📦 Packaging skill: {skill_path}")
-    if output_dir:
-        print(f"   Output directory: {output_dir}")
+    print(f"📦 Packaging skill: {args.skill_path}")
+    if args.output_dir:
+        print(f"   Output directory: {args.output_dir}")
     print()
 
-    result = package_skill(skill_path, output_dir)
+    result = package_skill(args.skill_path, args.output_dir)
 
     if result:
         sys.exit(0)
@@ -0,0 +1,126 @@
+"""Pool of isolated scratch project roots for trigger-eval runs.
+
+By default run_eval.py drops every probe command into the shared
+<project_root>/.claude/commands, so each concurrent `claude -p` also sees
+every other in-flight probe in its skill list. A ProbeRootPool instead hands
+each run its own scratch project root holding exactly one probe command.
+Roots are created up front, reused across runs, and the probe is rewritten
+in place only when the skill or description changes, so there is no
+per-query mkdir/write/unlink churn.
+
+The project's own configuration -- other commands, .claude/skills,
+settings, CLAUDE.md, .mcp.json -- is symlinked into every root, so the probe
+still competes with the same skills it would in the real project.
+"""
+
+import re
+import shutil
+import tempfile
+import uuid
+from pathlib import Path
+
+# Probe command files left behind by the shared-directory mode
+PROBE_FILE_RE = re.compile(r"-skill-[0-9a-f]{8}\.md$")
+
+MIRRORED_ROOT_FILES = ("CLAUDE.md", ".mcp.json")
+
+
+def write_command_file(command_file: Path, skill_name: str, skill_description: str) -> None:
+    command_file.parent.mkdir(parents=True, exist_ok=True)
+    # Use YAML block scalar to avoid breaking on quotes in description
+    indented_desc = "\n  ".join(skill_description.split("\n"))
+    command_content = (
+        f"---\n"
+        f"description: |\n"
+        f"  {indented_desc}\n"
+        f"---\n\n"
+        f"# {skill_name}\n\n"
+        f"This skill handles: {skill_description}\n"
+    )
+    command_file.write_text(command_content)
+
+
+class ProbeRoot:
+    """One scratch project root holding a single probe command."""
+
+    def __init__(self, path: Path, index: int):
+        self.path = path
+        self.index = index
+        self.token = uuid.uuid4().hex[:8]
+        self._installed: tuple[str, str] | None = None
+
+    def install(self, skill_name: str, description: str) -> str:
+        """Make this root's probe describe skill_name; return the probe's command name."""
+        clean_name = f"{skill_name}-skill-{self.token}"
+        if self._installed == (skill_name, description):
+            return clean_name
+        commands = self.path / ".claude" / "commands"
+        previous, self._installed = self._installed, None
+        if previous and previous[0] != skill_name:
+            (commands / f"{previous[0]}-skill-{self.token}.md").unlink(missing_ok=True)
+        write_command_file(commands / f"{clean_name}.md", skill_name, description)
+        self._installed = (skill_name, description)
+        return clean_name
+
+
+class ProbeRootPool:
+    """Reusable isolated project roots, one per concurrently running query.
+
+    acquire() never blocks: callers already bound concurrency with a
+    semaphore, so the pool only grows past its initial size if that bound is
+    larger. Usable as a context manager; close() deletes every root.
+    """
+
+    def __init__(self, size: int, mirror_root: Path | None = None, base_dir: Path | None = None):
+        self.mirror_root = Path(mirror_root) if mirror_root else None
+        self.base_dir = Path(tempfile.mkdtemp(prefix="skill-probe-roots-", dir=base_dir))
+        self._roots: list[ProbeRoot] = []
+        self._free: list[ProbeRoot] = []
+        for _ in range(size):
+            self._free.append(self._new_root())
+
+    def _new_root(self) -> ProbeRoot:
+        root = ProbeRoot(self.base_dir / f"root-{len(self._roots)}", len(self._roots))
+        commands = root.path / ".claude" / "commands"
+        commands.mkdir(parents=True)
+        if self.mirror_root is not None:
+            self._mirror_into(root.path)
+        self._roots.append(root)
+        return root
+
+    def _mirror_into(self, path: Path) -> None:
+        source_claude = self.mirror_root / ".claude"
+        if source_claude.is_dir():
+            for entry in source_claude.iterdir():
+                if entry.name != "commands":
+                    (path / ".claude" / entry.name).symlink_to(entry.resolve())
+            source_commands = source_claude / "commands"
+            if source_commands.is_dir():
+                for entry in source_commands.iterdir():
+                    if not PROBE_FILE_RE.search(entry.name):
+                        (path / ".claude" / "commands" / entry.name).symlink_to(entry.resolve())
+        for name in MIRRORED_ROOT_FILES:
+            entry = self.mirror_root / name
+            if entry.exists():
+                (path / name).symlink_to(entry.resolve())
+
+    @property
+    def size(self) -> int:
+        return len(self._roots)
+
+    def acquire(self) -> ProbeRoot:
+        return self._free.pop() if self._free else self._new_root()
+
+    def release(self, root: ProbeRoot) -> None:
+        self._free.append(root)
+
+    def close(self) -> None:
+        shutil.rmtree(self.base_dir, ignore_errors=True)
+        self._roots.clear()
+        self._free.clear()
+
+    def __enter__(self) -> "ProbeRootPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -3,21 +3,48 @@
 
 Tests whether a skill's description causes Claude to trigger (read the skill)
 for a set of queries. Outputs results as JSON.
+
+All `claude -p` children are driven from a single asyncio event loop: each
+run is a subprocess started directly under a concurrency semaphore, its
+stream-json output is read line by line, and the child is killed as soon as
+the trigger decision is known.
+
+With a ProbeRootPool (--isolate), each run instead gets its own pooled
+scratch project root holding only its probe command; see probe_roots.py.
+
+Every executed run is timed (spawn, first stream event, decision, kill) and
+the percentiles land in the output summary; --trace writes the per-run
+records as JSONL.
 """
 
 import argparse
+import asyncio
 import json
+import math
 import os
-import select
-import subprocess
 import sys
 import time
 import uuid
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections.abc import AsyncIterator
 from pathlib import Path
+from statistics import NormalDist
 
+from scripts.generate_report import LATENCY_PERCENTILES, format_latency
+from scripts.probe_roots import ProbeRoot, ProbeRootPool, write_command_file
+from scripts.trigger_cache import TriggerCache, description_hash
 from scripts.utils import parse_skill_md
 
+# StreamReader line limit. Full assistant messages arrive as one stream-json
+# line and can be large; the buffer only grows this far if a line needs it.
+STREAM_LINE_LIMIT = 16 * 1024 * 1024
+
+# Per-run timings recorded by run_single_query_async, in seconds from the
+# moment the run started.
+LATENCY_FIELDS = ("setup_s", "spawn_s", "first_event_s", "decision_s", "kill_s", "total_s")
+
+# TriggerDetector.source values that mean a real decision was observed
+DECIDED_SOURCES = ("stream_event", "assistant", "result")
+
 
 def find_project_root() -> Path:
     """Find the project root by walking up from cwd looking for .claude/.
@@ -32,40 +59,153 @@ def find_project_root() -> Path:
     return current
 
 
-def run_single_query(
+class TriggerDetector:
+    """Incrementally decide from stream-json events whether a skill triggered.
+
+    Uses --include-partial-messages stream events (content_block_start and
+    input_json_delta) to detect triggering early rather than waiting for the
+    full assistant message, which only arrives after tool execution. The
+    full assistant message is kept as a fallback.
+
+    After a decision, source names the path that produced it: "stream_event",
+    "assistant" (the fallback) or "result".
+    """
+
+    def __init__(self, clean_name: str):
+        self.clean_name = clean_name
+        self.pending_tool_name: str | None = None
+        self.accumulated_json = ""
+        self.source: str | None = None
+
+    def feed(self, event: dict) -> bool | None:
+        """Consume one event; return the decision once known, else None."""
+        decision = self._feed(event)
+        if decision is not None:
+            self.source = event.get("type")
+        return decision
+
+    def _feed(self, event: dict) -> bool | None:
+        event_type = event.get("type")
+
+        # Early detection via stream events
+        if event_type == "stream_event":
+            se = event.get("event", {})
+            se_type = se.get("type", "")
+
+            if se_type == "content_block_start":
+                cb = se.get("content_block", {})
+                if cb.get("type") == "tool_use":
+                    tool_name = cb.get("name", "")
+                    if tool_name in ("Skill", "Read"):
+                        self.pending_tool_name = tool_name
+                        self.accumulated_json = ""
+                    else:
+                        return False
+
+            elif se_type == "content_block_delta" and self.pending_tool_name:
+                delta = se.get("delta", {})
+                if delta.get("type") == "input_json_delta":
+                    self.accumulated_json += delta.get("partial_json", "")
+                    if self.clean_name in self.accumulated_json:
+                        return True
+
+            elif se_type in ("content_block_stop", "message_stop"):
+                if self.pending_tool_name:
+                    return self.clean_name in self.accumulated_json
+                if se_type == "message_stop":
+                    return False
+
+        # Fallback: full assistant message
+        elif event_type == "assistant":
+            message = event.get("message", {})
+            for content_item in message.get("content", []):
+                if content_item.get("type") != "tool_use":
+                    continue
+                tool_name = content_item.get("name", "")
+                tool_input = content_item.get("input", {})
+                if tool_name == "Skill" and self.clean_name in tool_input.get("skill", ""):
+                    return True
+                if tool_name == "Read" and self.clean_name in tool_input.get("file_path", ""):
+                    return True
+                return False
+
+        elif event_type == "result":
+            return False
+
+        return None
+
+
+async def _read_decision(
+    stream: asyncio.StreamReader,
+    detector: TriggerDetector,
+    timing: dict,
+    started: float,
+) -> bool:
+    while True:
+        try:
+            line = await stream.readline()
+        except ValueError:
+            # Line longer than STREAM_LINE_LIMIT; it can't be an event we act on
+            continue
+        if not line:
+            detector.source = "eof"
+            return False
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if timing.get("first_event_s") is None:
+            timing["first_event_s"] = time.perf_counter() - started
+        decision = detector.feed(event)
+        if decision is not None:
+            return decision
+
+
+async def run_single_query_async(
     query: str,
     skill_name: str,
     skill_description: str,
     timeout: int,
     project_root: str,
     model: str | None = None,
+    timing: dict | None = None,
+    probe_root: ProbeRoot | None = None,
 ) -> bool:
     """Run a single query and return whether the skill was triggered.
 
     Creates a command file in .claude/commands/ so it appears in Claude's
-    available_skills list, then runs `claude -p` with the raw query.
-    Uses --include-partial-messages to detect triggering early from
-    stream events (content_block_start) rather than waiting for the
-    full assistant message, which only arrives after tool execution.
+    available_skills list, then runs `claude -p` with the raw query. The
+    child is killed as soon as the decision is known or timeout elapses.
+
+    With probe_root, the probe is installed in that isolated root (rewritten
+    in place only if it changed) and claude runs there instead of in
+    project_root; nothing is created or removed in project_root.
+
+    If timing is given it is filled with LATENCY_FIELDS (None for phases the
+    run never reached), "timed_out", and "source" -- the TriggerDetector
+    path that decided, "eof" if the stream ended first, or "timeout".
     """
-    unique_id = uuid.uuid4().hex[:8]
-    clean_name = f"{skill_name}-skill-{unique_id}"
-    project_commands_dir = Path(project_root) / ".claude" / "commands"
-    command_file = project_commands_dir / f"{clean_name}.md"
+    if timing is None:
+        timing = {}
+    timing.update({field: None for field in LATENCY_FIELDS})
+    timing.update({"timed_out": False, "source": None})
+    started = time.perf_counter()
 
+    command_file = None
     try:
-        project_commands_dir.mkdir(parents=True, exist_ok=True)
-        # Use YAML block scalar to avoid breaking on quotes in description
-        indented_desc = "\n  ".join(skill_description.split("\n"))
-        command_content = (
-            f"---\n"
-            f"description: |\n"
-            f"  {indented_desc}\n"
-            f"---\n\n"
-            f"# {skill_name}\n\n"
-            f"This skill handles: {skill_description}\n"
-        )
-        command_file.write_text(command_content)
+        if probe_root is not None:
+            clean_name = probe_root.install(skill_name, skill_description)
+            cwd = str(probe_root.path)
+        else:
+            unique_id = uuid.uuid4().hex[:8]
+            clean_name = f"{skill_name}-skill-{unique_id}"
+            command_file = Path(project_root) / ".claude" / "commands" / f"{clean_name}.md"
+            write_command_file(command_file, skill_name, skill_description)
+            cwd = project_root
+        timing["setup_s"] = time.perf_counter() - started
 
         cmd = [
             "claude",
@@ -82,106 +222,165 @@ def run_single_query(
         # programmatic subprocess usage is safe.
         env = {k: v for k, v in os.environ.items() if k != "CLAUDECODE"}
 
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.DEVNULL,
-            cwd=project_root,
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            cwd=cwd,
             env=env,
+            limit=STREAM_LINE_LIMIT,
         )
+        timing["spawn_s"] = time.perf_counter() - started
 
-        triggered = False
-        start_time = time.time()
-        buffer = ""
-        # Track state for stream event detection
-        pending_tool_name = None
-        accumulated_json = ""
-
+        detector = TriggerDetector(clean_name)
         try:
-            while time.time() - start_time < timeout:
-                if process.poll() is not None:
-                    remaining = process.stdout.read()
-                    if remaining:
-                        buffer += remaining.decode("utf-8", errors="replace")
-                    break
-
-                ready, _, _ = select.select([process.stdout], [], [], 1.0)
-                if not ready:
-                    continue
-
-                chunk = os.read(process.stdout.fileno(), 8192)
-                if not chunk:
-                    break
-                buffer += chunk.decode("utf-8", errors="replace")
-
-                while "\n" in buffer:
-                    line, buffer = buffer.split("\n", 1)
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    try:
-                        event = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-
-                    # Early detection via stream events
-                    if event.get("type") == "stream_event":
-                        se = event.get("event", {})
-                        se_type = se.get("type", "")
-
-                        if se_type == "content_block_start":
-                            cb = se.get("content_block", {})
-                            if cb.get("type") == "tool_use":
-                                tool_name = cb.get("name", "")
-                                if tool_name in ("Skill", "Read"):
-                                    pending_tool_name = tool_name
-                                    accumulated_json = ""
-                                else:
-                                    return False
-
-                        elif se_type == "content_block_delta" and pending_tool_name:
-                            delta = se.get("delta", {})
-                            if delta.get("type") == "input_json_delta":
-                                accumulated_json += delta.get("partial_json", "")
-                                if clean_name in accumulated_json:
-                                    return True
-
-                        elif se_type in ("content_block_stop", "message_stop"):
-                            if pending_tool_name:
-                                return clean_name in accumulated_json
-                            if se_type == "message_stop":
-                                return False
-
-                    # Fallback: full assistant message
-                    elif event.get("type") == "assistant":
-                        message = event.get("message", {})
-                        for content_item in message.get("content", []):
-                            if content_item.get("type") != "tool_use":
-                                continue
-                            tool_name = content_item.get("name", "")
-                            tool_input = content_item.get("input", {})
-                            if tool_name == "Skill" and clean_name in tool_input.get("skill", ""):
-                                triggered = True
-                            elif tool_name == "Read" and clean_name in tool_input.get("file_path", ""):
-                                triggered = True
-                            return triggered
-
-                    elif event.get("type") == "result":
-                        return triggered
+            decision = await asyncio.wait_for(
+                _read_decision(process.stdout, detector, timing, started),
+                timeout,
+            )
+            timing["decision_s"] = time.perf_counter() - started
+            timing["source"] = detector.source
+            return decision
+        except asyncio.TimeoutError:
+            timing["timed_out"] = True
+            timing["source"] = "timeout"
+            return False
         finally:
-            # Clean up process on any exit path (return, exception, timeout)
-            if process.poll() is None:
-                process.kill()
-                process.wait()
-
-        return triggered
+            # Clean up process on any exit path (decision, exception, timeout)
+            kill_started = time.perf_counter()
+            if process.returncode is None:
+                try:
+                    process.kill()
+                except ProcessLookupError:
+                    pass
+                await process.wait()
+            timing["kill_s"] = time.perf_counter() - kill_started
     finally:
-        if command_file.exists():
+        if command_file is not None and command_file.exists():
             command_file.unlink()
+        timing["total_s"] = time.perf_counter() - started
 
 
-def run_eval(
+def run_single_query(
+    query: str,
+    skill_name: str,
+    skill_description: str,
+    timeout: int,
+    project_root: str,
+    model: str | None = None,
+) -> bool:
+    """Synchronous wrapper around run_single_query_async for one-off callers."""
+    return asyncio.run(
+        run_single_query_async(query, skill_name, skill_description, timeout, project_root, model)
+    )
+
+
+def verdict_is_settled(
+    triggers: int,
+    runs_done: int,
+    runs_planned: int,
+    trigger_threshold: float,
+    early_stop: str = "off",
+    confidence: float = 0.95,
+) -> bool:
+    """Return True once more runs of a query cannot (or are unlikely to) flip its verdict.
+
+    "exact" stops only when the threshold comparison is fixed no matter how
+    the remaining runs turn out -- e.g. 2/2 triggers with 3 runs and a 0.5
+    threshold. Because the observed rate always lies between the best and
+    worst case final rates, the verdict computed from the runs actually done
+    matches the one a full sweep would have produced.
+
+    "confidence" additionally stops when a one-sided Wilson score interval at
+    the given confidence level lies entirely on one side of the threshold.
+    """
+    if early_stop == "off" or runs_done == 0:
+        return False
+    if runs_done >= runs_planned:
+        return True
+
+    remaining = runs_planned - runs_done
+    if triggers / runs_planned >= trigger_threshold:
+        return True
+    if (triggers + remaining) / runs_planned < trigger_threshold:
+        return True
+
+    if early_stop == "confidence":
+        z = NormalDist().inv_cdf(confidence)
+        p = triggers / runs_done
+        denom = 1 + z * z / runs_done
+        center = (p + z * z / (2 * runs_done)) / denom
+        margin = z * math.sqrt(p * (1 - p) / runs_done + z * z / (4 * runs_done * runs_done)) / denom
+        if center - margin >= trigger_threshold or center + margin < trigger_threshold:
+            return True
+
+    return False
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Linearly interpolated percentile of values (pct in 0-100)."""
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * pct / 100
+    low = math.floor(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def latency_summary(records: list[dict]) -> dict:
+    """Summarize trace records into per-phase p50/p95/p99 plus outcome counts.
+
+    Cached runs carry no timings and are only counted.
+    """
+    executed = [r for r in records if not r.get("cached")]
+    summary: dict = {
+        "runs": len(executed),
+        "cached": len(records) - len(executed),
+        "timeouts": sum(1 for r in executed if r.get("timed_out")),
+        "errors": sum(1 for r in executed if r.get("error")),
+        "sources": {},
+    }
+    for r in executed:
+        source = r.get("source") or "error"
+        summary["sources"][source] = summary["sources"].get(source, 0) + 1
+    for field in LATENCY_FIELDS:
+        values = [r[field] for r in executed if r.get(field) is not None]
+        if not values:
+            continue
+        summary[field.removesuffix("_s")] = {
+            **{f"p{pct}": round(percentile(values, pct), 4) for pct in LATENCY_PERCENTILES},
+            "max": round(max(values), 4),
+            "n": len(values),
+        }
+    return summary
+
+
+def write_trace(path: Path, records: list[dict]) -> None:
+    """Append trace records to a JSONL file."""
+    with open(path, "a") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+
+def _query_result(item: dict, triggers: list[bool], trigger_threshold: float) -> dict:
+    trigger_rate = sum(triggers) / len(triggers) if triggers else 0.0
+    should_trigger = item["should_trigger"]
+    if should_trigger:
+        did_pass = trigger_rate >= trigger_threshold
+    else:
+        did_pass = trigger_rate < trigger_threshold
+    return {
+        "query": item["query"],
+        "should_trigger": should_trigger,
+        "trigger_rate": trigger_rate,
+        "triggers": sum(triggers),
+        "runs": len(triggers),
+        "pass": did_pass,
+    }
+
+
+async def iter_query_results(
     eval_set: list[dict],
     skill_name: str,
     description: str,
@@ -191,58 +390,168 @@ def run_eval(
     runs_per_query: int = 1,
     trigger_threshold: float = 0.5,
     model: str | None = None,
-) -> dict:
-    """Run the full eval set and return results."""
-    results = []
-
-    with ProcessPoolExecutor(max_workers=num_workers) as executor:
-        future_to_info = {}
+    cache: TriggerCache | None = None,
+    early_stop: str = "off",
+    confidence: float = 0.95,
+    semaphore: asyncio.Semaphore | None = None,
+    trace: list[dict] | None = None,
+    probe_pool: ProbeRootPool | None = None,
+) -> AsyncIterator[dict]:
+    """Evaluate eval_set, yielding each query's result as soon as it is final.
+
+    If a cache is given, runs whose (skill, description, query, model, run
+    index) outcome is already cached are not re-executed, and every fresh
+    outcome is written back to it.
+
+    Runs are queued round-robin (every query's run 0, then every query's run
+    1, ...) behind a semaphore of num_workers. With early_stop set to "exact"
+    or "confidence", a queued run is dropped when it reaches the front if
+    verdict_is_settled() says its query's pass/fail can no longer change.
+    Pass a shared semaphore to evaluate several descriptions concurrently
+    within one num_workers budget, and a shared probe_pool to run each of
+    them in isolated project roots so concurrent probes -- even for
+    different skills -- never see one another.
+
+    If trace is given, one record per run (timings from
+    run_single_query_async, or "cached": true) is appended to it.
+    """
+    query_triggers: dict[str, list[bool]] = {}
+    query_items: dict[str, dict] = {}
+    outstanding: dict[str, int] = {}
+    scheduled: list[tuple[dict, int, str | None]] = []
+    desc_hash = description_hash(description)[:12]
+
+    def record(query: str, run_idx: int, triggered: bool, **fields) -> None:
+        if trace is not None:
+            trace.append({
+                "skill_name": skill_name,
+                "description_hash": desc_hash,
+                "query": query,
+                "run": run_idx,
+                "triggered": triggered,
+                **fields,
+            })
+
+    for run_idx in range(runs_per_query):
         for item in eval_set:
-            for run_idx in range(runs_per_query):
-                future = executor.submit(
-                    run_single_query,
-                    item["query"],
-                    skill_name,
-                    description,
-                    timeout,
-                    str(project_root),
-                    model,
-                )
-                future_to_info[future] = (item, run_idx)
-
-        query_triggers: dict[str, list[bool]] = {}
-        query_items: dict[str, dict] = {}
-        for future in as_completed(future_to_info):
-            item, _ = future_to_info[future]
             query = item["query"]
             query_items[query] = item
-            if query not in query_triggers:
-                query_triggers[query] = []
-            try:
-                query_triggers[query].append(future.result())
-            except Exception as e:
-                print(f"Warning: query failed: {e}", file=sys.stderr)
-                query_triggers[query].append(False)
-
-    for query, triggers in query_triggers.items():
-        item = query_items[query]
-        trigger_rate = sum(triggers) / len(triggers)
-        should_trigger = item["should_trigger"]
-        if should_trigger:
-            did_pass = trigger_rate >= trigger_threshold
-        else:
-            did_pass = trigger_rate < trigger_threshold
-        results.append({
-            "query": query,
-            "should_trigger": should_trigger,
-            "trigger_rate": trigger_rate,
-            "triggers": sum(triggers),
-            "runs": len(triggers),
-            "pass": did_pass,
-        })
+            query_triggers.setdefault(query, [])
+            outstanding.setdefault(query, 0)
+            cache_key = None
+            if cache is not None:
+                cache_key = cache.make_key(
+                    skill_name, description, query, model, run_idx, isolated=probe_pool is not None,
+                )
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    query_triggers[query].append(cached)
+                    record(query, run_idx, cached, cached=True)
+                    continue
+            scheduled.append((item, run_idx, cache_key))
+            outstanding[query] += 1
+
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(num_workers)
+    finished: asyncio.Queue[str] = asyncio.Queue()
+
+    def settled(query: str) -> bool:
+        triggers = query_triggers[query]
+        return verdict_is_settled(
+            sum(triggers), len(triggers), runs_per_query,
+            trigger_threshold, early_stop, confidence,
+        )
+
+    async def run_one(item: dict, run_idx: int, cache_key: str | None) -> None:
+        query = item["query"]
+        try:
+            # Semaphore waiters are woken FIFO, so runs start in queue order
+            async with semaphore:
+                if settled(query):
+                    return
+                timing: dict = {}
+                probe_root = probe_pool.acquire() if probe_pool is not None else None
+                try:
+                    triggered = await run_single_query_async(
+                        query, skill_name, description, timeout, str(project_root), model, timing,
+                        probe_root,
+                    )
+                except Exception as e:
+                    print(f"Warning: query failed: {e}", file=sys.stderr)
+                    query_triggers[query].append(False)
+                    record(query, run_idx, False, error=str(e), **timing)
+                    return
+                finally:
+                    if probe_root is not None:
+                        probe_pool.release(probe_root)
+                query_triggers[query].append(triggered)
+                record(query, run_idx, triggered, **timing)
+                # Only runs that reached a decision from the stream are cached;
+                # errors, timeouts and streams that ended undecided get retried
+                if cache_key is not None and timing["source"] in DECIDED_SOURCES:
+                    cache.put(cache_key, triggered, skill_name)
+        finally:
+            outstanding[query] -= 1
+            if outstanding[query] == 0:
+                finished.put_nowait(query)
+
+    for query, count in outstanding.items():
+        if count == 0:
+            finished.put_nowait(query)
+
+    tasks = [
+        asyncio.create_task(run_one(item, run_idx, cache_key))
+        for item, run_idx, cache_key in scheduled
+    ]
+    try:
+        for _ in range(len(query_items)):
+            query = await finished.get()
+            yield _query_result(query_items[query], query_triggers[query], trigger_threshold)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if cache is not None:
+            cache.prune()
+
+
+async def run_eval_async(
+    eval_set: list[dict],
+    skill_name: str,
+    description: str,
+    num_workers: int,
+    timeout: int,
+    project_root: Path,
+    runs_per_query: int = 1,
+    trigger_threshold: float = 0.5,
+    model: str | None = None,
+    cache: TriggerCache | None = None,
+    early_stop: str = "off",
+    confidence: float = 0.95,
+    semaphore: asyncio.Semaphore | None = None,
+    trace: list[dict] | None = None,
+    probe_pool: ProbeRootPool | None = None,
+) -> dict:
+    """Run the full eval set and return results. See iter_query_results.
+
+    The summary's "latency" covers this call's runs; pass trace to also
+    collect the raw per-run records.
+    """
+    records: list[dict] = []
+    results = [
+        result
+        async for result in iter_query_results(
+            eval_set, skill_name, description, num_workers, timeout, project_root,
+            runs_per_query, trigger_threshold, model, cache, early_stop, confidence,
+            semaphore, records, probe_pool,
+        )
+    ]
+    if trace is not None:
+        trace.extend(records)
 
     passed = sum(1 for r in results if r["pass"])
     total = len(results)
+    runs = sum(r["runs"] for r in results)
 
     return {
         "skill_name": skill_name,
@@ -252,10 +561,52 @@ def run_eval(
             "total": total,
             "passed": passed,
             "failed": total - passed,
+            "runs": runs,
+            "runs_skipped": total * runs_per_query - runs,
+            "latency": latency_summary(records),
         },
     }
 
 
+def run_eval(
+    eval_set: list[dict],
+    skill_name: str,
+    description: str,
+    num_workers: int,
+    timeout: int,
+    project_root: Path,
+    runs_per_query: int = 1,
+    trigger_threshold: float = 0.5,
+    model: str | None = None,
+    cache: TriggerCache | None = None,
+    early_stop: str = "off",
+    confidence: float = 0.95,
+    trace: list[dict] | None = None,
+    probe_pool: ProbeRootPool | None = None,
+) -> dict:
+    """Run the full eval set and return results.
+
+    Each result's "runs" is the number of runs actually used, which is less
+    than runs_per_query when early stopping cut a query short.
+    """
+    return asyncio.run(run_eval_async(
+        eval_set=eval_set,
+        skill_name=skill_name,
+        description=description,
+        num_workers=num_workers,
+        timeout=timeout,
+        project_root=project_root,
+        runs_per_query=runs_per_query,
+        trigger_threshold=trigger_threshold,
+        model=model,
+        cache=cache,
+        early_stop=early_stop,
+        confidence=confidence,
+        trace=trace,
+        probe_pool=probe_pool,
+    ))
+
+
 def main():
     parser = argparse.ArgumentParser(description="Run trigger evaluation for a skill description")
     parser.add_argument("--eval-set", required=True, help="Path to eval set JSON file")
@@ -266,6 +617,13 @@ def main():
     parser.add_argument("--runs-per-query", type=int, default=3, help="Number of runs per query")
     parser.add_argument("--trigger-threshold", type=float, default=0.5, help="Trigger rate threshold")
     parser.add_argument("--model", default=None, help="Model to use for claude -p (default: user's configured model)")
+    parser.add_argument("--early-stop", choices=["off", "exact", "confidence"], default="off", help="Stop running a query once its pass/fail verdict is settled (default: off)")
+    parser.add_argument("--confidence", type=float, default=0.95, help="Confidence level for --early-stop confidence")
+    parser.add_argument("--cache-dir", default=None, help="Trigger-result cache directory (default: ~/.cache/skill-creator/trigger-cache)")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the trigger-result cache entirely")
+    parser.add_argument("--clear-cache", action="store_true", help="Drop cached results for this skill before evaluating")
+    parser.add_argument("--isolate", action="store_true", help="Run each query in a pooled scratch project root holding only its own probe command")
+    parser.add_argument("--trace", default=None, help="Append per-run timing records to this JSONL file")
     parser.add_argument("--verbose", action="store_true", help="Print progress to stderr")
     args = parser.parse_args()
 
@@ -280,24 +638,47 @@ def main():
     description = args.description or original_description
     project_root = find_project_root()
 
+    cache = None if args.no_cache else TriggerCache(Path(args.cache_dir) if args.cache_dir else None)
+    if cache is not None and args.clear_cache:
+        removed = cache.clear(skill_name=name)
+        if args.verbose:
+            print(f"Cleared {removed} cached results for {name}", file=sys.stderr)
+
     if args.verbose:
         print(f"Evaluating: {description}", file=sys.stderr)
 
-    output = run_eval(
-        eval_set=eval_set,
-        skill_name=name,
-        description=description,
-        num_workers=args.num_workers,
-        timeout=args.timeout,
-        project_root=project_root,
-        runs_per_query=args.runs_per_query,
-        trigger_threshold=args.trigger_threshold,
-        model=args.model,
-    )
+    trace: list[dict] = []
+    probe_pool = ProbeRootPool(args.num_workers, mirror_root=project_root) if args.isolate else None
+    try:
+        output = run_eval(
+            eval_set=eval_set,
+            skill_name=name,
+            description=description,
+            num_workers=args.num_workers,
+            timeout=args.timeout,
+            project_root=project_root,
+            runs_per_query=args.runs_per_query,
+            trigger_threshold=args.trigger_threshold,
+            model=args.model,
+            cache=cache,
+            early_stop=args.early_stop,
+            confidence=args.confidence,
+            trace=trace,
+            probe_pool=probe_pool,
+        )
+    finally:
+        if probe_pool is not None:
+            probe_pool.close()
+    if args.trace:
+        write_trace(Path(args.trace), trace)
 
     if args.verbose:
         summary = output["summary"]
-        print(f"Results: {summary['passed']}/{summary['total']} passed", file=sys.stderr)
+        print(f"Results: {summary['passed']}/{summary['total']} passed ({summary['runs']} runs, {summary['runs_skipped']} skipped)", file=sys.stderr)
+        if cache is not None:
+            print(f"Cache: {cache.hits} hits, {cache.misses} misses", file=sys.stderr)
+        latency = summary["latency"]
+        print(f"Latency p50/p95/p99: decision {format_latency(latency)}, first event {format_latency(latency, 'first_event')}, kill {format_latency(latency, 'kill')} ({latency['timeouts']} timeouts)", file=sys.stderr)
         for r in output["results"]:
             status = "PASS" if r["pass"] else "FAIL"
             rate_str = f"{r['triggers']}/{r['runs']}"
@@ -7,7 +7,9 @@ overfitting.
 """
 
 import argparse
+import asyncio
 import json
+import math
 import random
 import sys
 import tempfile
@@ -15,9 +17,17 @@ import time
 import webbrowser
 from pathlib import Path
 
-from scripts.generate_report import generate_html
+from scripts.generate_report import format_latency, generate_html
 from scripts.improve_description import improve_description
-from scripts.run_eval import find_project_root, run_eval
+from scripts.probe_roots import ProbeRootPool
+from scripts.run_eval import (
+    find_project_root,
+    latency_summary,
+    run_eval,
+    run_eval_async,
+    write_trace,
+)
+from scripts.trigger_cache import TriggerCache
 from scripts.utils import parse_skill_md
 
 
@@ -44,6 +54,97 @@ def split_eval_set(eval_set: list[dict], holdout: float, seed: int = 42) -> tupl
     return train_set, test_set
 
 
+def build_history_entry(
+    iteration: int,
+    description: str,
+    results: list[dict],
+    train_set: list[dict],
+    test_set: list[dict],
+) -> dict:
+    """Split one description's eval results into train/test and build its history entry."""
+    # Split results back into train/test by matching queries
+    train_queries_set = {q["query"] for q in train_set}
+    train_result_list = [r for r in results if r["query"] in train_queries_set]
+    test_result_list = [r for r in results if r["query"] not in train_queries_set]
+
+    train_passed = sum(1 for r in train_result_list if r["pass"])
+    train_total = len(train_result_list)
+
+    if test_set and test_result_list:
+        test_passed = sum(1 for r in test_result_list if r["pass"])
+        test_total = len(test_result_list)
+        test_failed = test_total - test_passed
+    else:
+        test_passed = test_total = test_failed = None
+        test_result_list = None
+
+    return {
+        "iteration": iteration,
+        "description": description,
+        "train_passed": train_passed,
+        "train_failed": train_total - train_passed,
+        "train_total": train_total,
+        "train_results": train_result_list,
+        "test_passed": test_passed,
+        "test_failed": test_failed,
+        "test_total": test_total,
+        "test_results": test_result_list,
+        # For backward compat with report generator
+        "passed": train_passed,
+        "failed": train_total - train_passed,
+        "total": train_total,
+        "results": train_result_list,
+    }
+
+
+def train_eval_results(entry: dict) -> dict:
+    """Rebuild the run_eval-style train results dict improve_description expects."""
+    return {
+        "results": entry["train_results"],
+        "summary": {
+            "passed": entry["train_passed"],
+            "failed": entry["train_failed"],
+            "total": entry["train_total"],
+        },
+    }
+
+
+def blind_history(history: list[dict]) -> list[dict]:
+    """Strip test scores from history so improvement model can't see them."""
+    return [
+        {k: v for k, v in h.items() if not k.startswith("test_")}
+        for h in history
+    ]
+
+
+def select_best(history: list[dict], has_test: bool) -> dict:
+    """Pick the best fully-evaluated entry by TEST score (or train if no test set)."""
+    complete = [h for h in history if not h.get("pruned")]
+    if has_test:
+        return max(complete, key=lambda h: h["test_passed"] or 0)
+    return max(complete, key=lambda h: h["train_passed"])
+
+
+def print_eval_stats(label: str, results: list[dict], elapsed: float) -> None:
+    pos = [r for r in results if r["should_trigger"]]
+    neg = [r for r in results if not r["should_trigger"]]
+    tp = sum(r["triggers"] for r in pos)
+    pos_runs = sum(r["runs"] for r in pos)
+    fn = pos_runs - tp
+    fp = sum(r["triggers"] for r in neg)
+    neg_runs = sum(r["runs"] for r in neg)
+    tn = neg_runs - fp
+    total = tp + tn + fp + fn
+    precision = tp / (tp + fp) if (tp + fp) > 0 else 1.0
+    recall = tp / (tp + fn) if (tp + fn) > 0 else 1.0
+    accuracy = (tp + tn) / total if total > 0 else 0.0
+    print(f"{label}: {tp+tn}/{total} correct, precision={precision:.0%} recall={recall:.0%} accuracy={accuracy:.0%} ({elapsed:.1f}s)", file=sys.stderr)
+    for r in results:
+        status = "PASS" if r["pass"] else "FAIL"
+        rate_str = f"{r['triggers']}/{r['runs']}"
+        print(f"  [{status}] rate={rate_str} expected={r['should_trigger']}: {r['query'][:60]}", file=sys.stderr)
+
+
 def run_loop(
     eval_set: list[dict],
     skill_path: Path,
@@ -58,8 +159,30 @@ def run_loop(
     verbose: bool,
     live_report_path: Path | None = None,
     log_dir: Path | None = None,
+    cache: TriggerCache | None = None,
+    early_stop: str = "off",
+    confidence: float = 0.95,
+    candidates: int = 1,
+    screen_fraction: float = 0.5,
+    trace_path: Path | None = None,
+    probe_pool: ProbeRootPool | None = None,
 ) -> dict:
-    """Run the eval + improvement loop."""
+    """Run the eval + improvement loop.
+
+    With candidates > 1, each iteration after the first proposes that many
+    descriptions concurrently and searches them with successive halving:
+    every candidate is screened on a stratified screen_fraction of the train
+    set, the top half go on to the rest of train and the test set, and the
+    rest are recorded in history as pruned. All evaluation shares one pool
+    of num_workers slots.
+
+    Every history entry gets a "latency" summary of its own runs, and the
+    output a "latency" summary over all of them. With trace_path, per-run
+    records tagged with iteration and candidate are appended as JSONL.
+
+    With a probe_pool, every run (across all iterations and candidates)
+    executes in one of its isolated project roots.
+    """
     project_root = find_project_root()
     name, original_description, content = parse_skill_md(skill_path)
     current_description = description_override or original_description
@@ -74,107 +197,114 @@ def run_loop(
         test_set = []
 
     history = []
+    all_records: list[dict] = []
     exit_reason = "unknown"
+    eval_kwargs = {
+        "skill_name": name,
+        "num_workers": num_workers,
+        "timeout": timeout,
+        "project_root": project_root,
+        "runs_per_query": runs_per_query,
+        "trigger_threshold": trigger_threshold,
+        "model": model,
+        "cache": cache,
+        "early_stop": early_stop,
+        "confidence": confidence,
+        "probe_pool": probe_pool,
+    }
 
-    for iteration in range(1, max_iterations + 1):
-        if verbose:
-            print(f"\n{'='*60}", file=sys.stderr)
-            print(f"Iteration {iteration}/{max_iterations}", file=sys.stderr)
-            print(f"Description: {current_description}", file=sys.stderr)
-            print(f"{'='*60}", file=sys.stderr)
+    def write_live_report(best_description: str) -> None:
+        if not live_report_path:
+            return
+        partial_output = {
+            "original_description": original_description,
+            "best_description": best_description,
+            "best_score": "in progress",
+            "iterations_run": iteration,
+            "holdout": holdout,
+            "train_size": len(train_set),
+            "test_size": len(test_set),
+            "history": history,
+        }
+        live_report_path.write_text(generate_html(partial_output, auto_refresh=True, skill_name=name))
+
+    def record_trace(entry: dict, records: list[dict]) -> None:
+        tags = {"iteration": entry["iteration"], "candidate": entry.get("candidate")}
+        tagged = [{**tags, **r} for r in records]
+        all_records.extend(tagged)
+        entry["latency"] = latency_summary(records)
+        if trace_path:
+            write_trace(trace_path, tagged)
 
-        # Evaluate train + test together in one batch for parallelism
-        all_queries = train_set + test_set
-        t0 = time.time()
-        all_results = run_eval(
-            eval_set=all_queries,
-            skill_name=name,
-            description=current_description,
-            num_workers=num_workers,
-            timeout=timeout,
-            project_root=project_root,
-            runs_per_query=runs_per_query,
-            trigger_threshold=trigger_threshold,
-            model=model,
-        )
-        eval_elapsed = time.time() - t0
-
-        # Split results back into train/test by matching queries
-        train_queries_set = {q["query"] for q in train_set}
-        train_result_list = [r for r in all_results["results"] if r["query"] in train_queries_set]
-        test_result_list = [r for r in all_results["results"] if r["query"] not in train_queries_set]
-
-        train_passed = sum(1 for r in train_result_list if r["pass"])
-        train_total = len(train_result_list)
-        train_summary = {"passed": train_passed, "failed": train_total - train_passed, "total": train_total}
-        train_results = {"results": train_result_list, "summary": train_summary}
-
-        if test_set:
-            test_passed = sum(1 for r in test_result_list if r["pass"])
-            test_total = len(test_result_list)
-            test_summary = {"passed": test_passed, "failed": test_total - test_passed, "total": test_total}
-            test_results = {"results": test_result_list, "summary": test_summary}
+    for iteration in range(1, max_iterations + 1):
+        if candidates > 1 and iteration > 1:
+            if verbose:
+                print(f"\n{'='*60}", file=sys.stderr)
+                print(f"Iteration {iteration}/{max_iterations}: searching {candidates} candidates", file=sys.stderr)
+                print(f"{'='*60}", file=sys.stderr)
+            t0 = time.time()
+            entry_records: list[list[dict]] = []
+            entries = asyncio.run(search_candidates(
+                iteration=iteration,
+                num_candidates=candidates,
+                screen_fraction=screen_fraction,
+                history=history,
+                train_set=train_set,
+                test_set=test_set,
+                skill_content=content,
+                improve_model=model,
+                log_dir=log_dir,
+                eval_kwargs=eval_kwargs,
+                verbose=verbose,
+                traces=entry_records,
+            ))
+            for entry, records in zip(entries, entry_records):
+                record_trace(entry, records)
+            history.extend(entries)
+            survivors = [h for h in entries if not h["pruned"]]
+            current = max(survivors, key=lambda h: h["train_passed"])
+            current_description = current["description"]
+            write_live_report(current_description)
+            if verbose:
+                print(f"Iteration {iteration} searched in {time.time() - t0:.1f}s; best train candidate:", file=sys.stderr)
+                print_eval_stats("Train", current["train_results"], 0)
+                if current["test_results"]:
+                    print_eval_stats("Test ", current["test_results"], 0)
         else:
-            test_results = None
-            test_summary = None
-
-        history.append({
-            "iteration": iteration,
-            "description": current_description,
-            "train_passed": train_summary["passed"],
-            "train_failed": train_summary["failed"],
-            "train_total": train_summary["total"],
-            "train_results": train_results["results"],
-            "test_passed": test_summary["passed"] if test_summary else None,
-            "test_failed": test_summary["failed"] if test_summary else None,
-            "test_total": test_summary["total"] if test_summary else None,
-            "test_results": test_results["results"] if test_results else None,
-            # For backward compat with report generator
-            "passed": train_summary["passed"],
-            "failed": train_summary["failed"],
-            "total": train_summary["total"],
-            "results": train_results["results"],
-        })
-
-        # Write live report if path provided
-        if live_report_path:
-            partial_output = {
-                "original_description": original_description,
-                "best_description": current_description,
-                "best_score": "in progress",
-                "iterations_run": len(history),
-                "holdout": holdout,
-                "train_size": len(train_set),
-                "test_size": len(test_set),
-                "history": history,
-            }
-            live_report_path.write_text(generate_html(partial_output, auto_refresh=True, skill_name=name))
+            if verbose:
+                print(f"\n{'='*60}", file=sys.stderr)
+                print(f"Iteration {iteration}/{max_iterations}", file=sys.stderr)
+                print(f"Description: {current_description}", file=sys.stderr)
+                print(f"{'='*60}", file=sys.stderr)
+
+            # Evaluate train + test together in one batch for parallelism
+            all_queries = train_set + test_set
+            t0 = time.time()
+            records: list[dict] = []
+            all_results = run_eval(
+                eval_set=all_queries,
+                description=current_description,
+                trace=records,
+                **eval_kwargs,
+            )
+            eval_elapsed = time.time() - t0
+
+            current = build_history_entry(iteration, current_description, all_results["results"], train_set, test_set)
+            if candidates > 1:
+                current["candidate"] = 1
+                current["pruned"] = False
+            record_trace(current, records)
+            history.append(current)
+            write_live_report(current_description)
 
-        if verbose:
-            def print_eval_stats(label, results, elapsed):
-                pos = [r for r in results if r["should_trigger"]]
-                neg = [r for r in results if not r["should_trigger"]]
-                tp = sum(r["triggers"] for r in pos)
-                pos_runs = sum(r["runs"] for r in pos)
-                fn = pos_runs - tp
-                fp = sum(r["triggers"] for r in neg)
-                neg_runs = sum(r["runs"] for r in neg)
-                tn = neg_runs - fp
-                total = tp + tn + fp + fn
-                precision = tp / (tp + fp) if (tp + fp) > 0 else 1.0
-                recall = tp / (tp + fn) if (tp + fn) > 0 else 1.0
-                accuracy = (tp + tn) / total if total > 0 else 0.0
-                print(f"{label}: {tp+tn}/{total} correct, precision={precision:.0%} recall={recall:.0%} accuracy={accuracy:.0%} ({elapsed:.1f}s)", file=sys.stderr)
-                for r in results:
-                    status = "PASS" if r["pass"] else "FAIL"
-                    rate_str = f"{r['triggers']}/{r['runs']}"
-                    print(f"  [{status}] rate={rate_str} expected={r['should_trigger']}: {r['query'][:60]}", file=sys.stderr)
-
-            print_eval_stats("Train", train_results["results"], eval_elapsed)
-            if test_summary:
-                print_eval_stats("Test ", test_results["results"], 0)
-
-        if train_summary["failed"] == 0:
+            if verbose:
+                print_eval_stats("Train", current["train_results"], eval_elapsed)
+                if current["test_results"]:
+                    print_eval_stats("Test ", current["test_results"], 0)
+                latency = current["latency"]
+                print(f"Latency p50/p95/p99: decision {format_latency(latency)} ({latency['timeouts']} timeouts)", file=sys.stderr)
+
+        if current["train_failed"] == 0:
             exit_reason = f"all_passed (iteration {iteration})"
             if verbose:
                 print(f"\nAll train queries passed on iteration {iteration}!", file=sys.stderr)
@@ -186,22 +316,21 @@ def run_loop(
                 print(f"\nMax iterations reached ({max_iterations}).", file=sys.stderr)
             break
 
+        if candidates > 1:
+            # The next iteration proposes and evaluates its own candidates
+            continue
+
         # Improve the description based on train results
         if verbose:
             print(f"\nImproving description...", file=sys.stderr)
 
         t0 = time.time()
-        # Strip test scores from history so improvement model can't see them
-        blinded_history = [
-            {k: v for k, v in h.items() if not k.startswith("test_")}
-            for h in history
-        ]
         new_description = improve_description(
             skill_name=name,
             skill_content=content,
             current_description=current_description,
-            eval_results=train_results,
-            history=blinded_history,
+            eval_results=train_eval_results(current),
+            history=blind_history(history),
             model=model,
             log_dir=log_dir,
             iteration=iteration,
@@ -213,12 +342,10 @@ def run_loop(
 
         current_description = new_description
 
-    # Find the best iteration by TEST score (or train if no test set)
+    best = select_best(history, bool(test_set))
     if test_set:
-        best = max(history, key=lambda h: h["test_passed"] or 0)
         best_score = f"{best['test_passed']}/{best['test_total']}"
     else:
-        best = max(history, key=lambda h: h["train_passed"])
         best_score = f"{best['train_passed']}/{best['train_total']}"
 
     if verbose:
@@ -233,14 +360,114 @@ def run_loop(
         "best_train_score": f"{best['train_passed']}/{best['train_total']}",
         "best_test_score": f"{best['test_passed']}/{best['test_total']}" if test_set else None,
         "final_description": current_description,
-        "iterations_run": len(history),
+        "iterations_run": iteration,
         "holdout": holdout,
         "train_size": len(train_set),
         "test_size": len(test_set),
+        "latency": latency_summary(all_records),
         "history": history,
     }
 
 
+async def search_candidates(
+    iteration: int,
+    num_candidates: int,
+    screen_fraction: float,
+    history: list[dict],
+    train_set: list[dict],
+    test_set: list[dict],
+    skill_content: str,
+    improve_model: str,
+    log_dir: Path | None,
+    eval_kwargs: dict,
+    verbose: bool,
+    traces: list[list[dict]] | None = None,
+) -> list[dict]:
+    """Propose num_candidates descriptions and search them by successive halving.
+
+    Each candidate is improved from one of the best fully-evaluated entries
+    so far and starts screening as soon as its description comes back, so
+    evaluation overlaps the slow `claude -p` improvement calls. Returns one
+    history entry per candidate, tagged with "candidate" and "pruned". If
+    traces is given, it receives each candidate's run records in the same
+    order.
+    """
+    semaphore = asyncio.Semaphore(eval_kwargs["num_workers"])
+    skill_name = eval_kwargs["skill_name"]
+
+    # Same stratified screen subset every iteration so screen scores compare
+    rest_train, screen_set = split_eval_set(train_set, screen_fraction)
+
+    complete = sorted(
+        (h for h in history if not h.get("pruned")),
+        key=lambda h: h["train_passed"],
+        reverse=True,
+    )
+    parents = complete[:max(1, math.ceil(num_candidates / 2))]
+    blinded_history = blind_history(history)
+    records: list[list[dict]] = [[] for _ in range(num_candidates)]
+
+    async def propose_and_screen(index: int) -> tuple[str, list[dict]]:
+        parent = parents[index % len(parents)]
+        description = await asyncio.to_thread(
+            improve_description,
+            skill_name=skill_name,
+            skill_content=skill_content,
+            current_description=parent["description"],
+            eval_results=train_eval_results(parent),
+            history=blinded_history,
+            model=improve_model,
+            log_dir=log_dir,
+            iteration=f"{iteration}-{index + 1}",
+        )
+        if verbose:
+            print(f"Candidate {index + 1} proposed: {description}", file=sys.stderr)
+        screened = await run_eval_async(
+            eval_set=screen_set, description=description, semaphore=semaphore,
+            trace=records[index], **eval_kwargs,
+        )
+        return description, screened["results"]
+
+    screened = await asyncio.gather(*(propose_and_screen(i) for i in range(num_candidates)))
+
+    def screen_score(index: int) -> int:
+        return sum(1 for r in screened[index][1] if r["pass"])
+
+    ranked = sorted(range(num_candidates), key=screen_score, reverse=True)
+    survivors = set(ranked[:max(1, math.ceil(num_candidates / 2))])
+    if verbose:
+        for index in range(num_candidates):
+            status = "kept" if index in survivors else "pruned"
+            print(f"Candidate {index + 1}: {screen_score(index)}/{len(screen_set)} on screen set ({status})", file=sys.stderr)
+
+    async def finish(index: int) -> list[dict]:
+        description, results = screened[index]
+        rest = await run_eval_async(
+            eval_set=rest_train + test_set, description=description, semaphore=semaphore,
+            trace=records[index], **eval_kwargs,
+        )
+        return results + rest["results"]
+
+    ordered_survivors = sorted(survivors)
+    finished = await asyncio.gather(*(finish(i) for i in ordered_survivors))
+    full_results = dict(zip(ordered_survivors, finished))
+
+    entries = []
+    for index in range(num_candidates):
+        description, results = screened[index]
+        entry = build_history_entry(
+            iteration, description, full_results.get(index, results), train_set, test_set,
+        )
+        entry["candidate"] = index + 1
+        entry["pruned"] = index not in survivors
+        if entry["pruned"]:
+            entry["note"] = f"Pruned after screening on {len(screen_set)} of {len(train_set)} train queries."
+        entries.append(entry)
+    if traces is not None:
+        traces.extend(records)
+    return entries
+
+
 def main():
     parser = argparse.ArgumentParser(description="Run eval + improve loop")
     parser.add_argument("--eval-set", required=True, help="Path to eval set JSON file")
@@ -253,6 +480,15 @@ def main():
     parser.add_argument("--trigger-threshold", type=float, default=0.5, help="Trigger rate threshold")
     parser.add_argument("--holdout", type=float, default=0.4, help="Fraction of eval set to hold out for testing (0 to disable)")
     parser.add_argument("--model", required=True, help="Model for improvement")
+    parser.add_argument("--candidates", type=int, default=1, help="Descriptions to propose and search per iteration (default: 1, serial)")
+    parser.add_argument("--screen-fraction", type=float, default=0.5, help="Fraction of train queries used to screen candidates before halving")
+    parser.add_argument("--early-stop", choices=["off", "exact", "confidence"], default="off", help="Stop running a query once its pass/fail verdict is settled (default: off)")
+    parser.add_argument("--confidence", type=float, default=0.95, help="Confidence level for --early-stop confidence")
+    parser.add_argument("--cache-dir", default=None, help="Trigger-result cache directory (default: ~/.cache/skill-creator/trigger-cache)")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the trigger-result cache entirely")
+    parser.add_argument("--clear-cache", action="store_true", help="Drop cached results for this skill before starting")
+    parser.add_argument("--isolate", action="store_true", help="Run each query in a pooled scratch project root holding only its own probe command")
+    parser.add_argument("--trace", default=None, help="Append per-run timing records to this JSONL file (default: trace.jsonl in --results-dir, if set)")
     parser.add_argument("--verbose", action="store_true", help="Print progress to stderr")
     parser.add_argument("--report", default="auto", help="Generate HTML report at this path (default: 'auto' for temp file, 'none' to disable)")
     parser.add_argument("--results-dir", default=None, help="Save all outputs (results.json, report.html, log.txt) to a timestamped subdirectory here")
@@ -267,6 +503,12 @@ def main():
 
     name, _, _ = parse_skill_md(skill_path)
 
+    cache = None if args.no_cache else TriggerCache(Path(args.cache_dir) if args.cache_dir else None)
+    if cache is not None and args.clear_cache:
+        removed = cache.clear(skill_name=name)
+        if args.verbose:
+            print(f"Cleared {removed} cached results for {name}", file=sys.stderr)
+
     # Set up live report path
     if args.report != "none":
         if args.report == "auto":
@@ -289,22 +531,38 @@ def main():
         results_dir = None
 
     log_dir = results_dir / "logs" if results_dir else None
-
-    output = run_loop(
-        eval_set=eval_set,
-        skill_path=skill_path,
-        description_override=args.description,
-        num_workers=args.num_workers,
-        timeout=args.timeout,
-        max_iterations=args.max_iterations,
-        runs_per_query=args.runs_per_query,
-        trigger_threshold=args.trigger_threshold,
-        holdout=args.holdout,
-        model=args.model,
-        verbose=args.verbose,
-        live_report_path=live_report_path,
-        log_dir=log_dir,
-    )
+    if args.trace:
+        trace_path = Path(args.trace)
+    else:
+        trace_path = results_dir / "trace.jsonl" if results_dir else None
+
+    probe_pool = ProbeRootPool(args.num_workers, mirror_root=find_project_root()) if args.isolate else None
+    try:
+        output = run_loop(
+            eval_set=eval_set,
+            skill_path=skill_path,
+            description_override=args.description,
+            num_workers=args.num_workers,
+            timeout=args.timeout,
+            max_iterations=args.max_iterations,
+            runs_per_query=args.runs_per_query,
+            trigger_threshold=args.trigger_threshold,
+            holdout=args.holdout,
+            model=args.model,
+            verbose=args.verbose,
+            live_report_path=live_report_path,
+            log_dir=log_dir,
+            cache=cache,
+            early_stop=args.early_stop,
+            confidence=args.confidence,
+            candidates=args.candidates,
+            screen_fraction=args.screen_fraction,
+            trace_path=trace_path,
+            probe_pool=probe_pool,
+        )
+    finally:
+        if probe_pool is not None:
+            probe_pool.close()
 
     # Save JSON output
     json_output = json.dumps(output, indent=2)
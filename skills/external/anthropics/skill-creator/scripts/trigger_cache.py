@@ -0,0 +1,148 @@
+"""On-disk cache of single trigger-eval runs.
+
+Each `claude -p` run in run_eval.py is keyed by (skill name, description
+hash, query, model, run index, isolated) and its boolean outcome is stored as
+a small JSON file. Shared-directory and isolated (--isolate) runs see
+different skill lists, so their outcomes are never served for one another. Re-evaluating a description that was already tried -- the optimizer
+circling back to an earlier candidate, or re-running run_eval.py by hand --
+then costs nothing. Entries are evicted least-recently-used once the cache
+grows past max_entries.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+# Bump when the meaning of a cached outcome changes (e.g. detection logic in
+# run_single_query), so stale entries are ignored rather than trusted.
+CACHE_VERSION = 1
+
+DEFAULT_MAX_ENTRIES = 50_000
+
+
+def default_cache_dir() -> Path:
+    """Return the cache directory, honoring SKILL_CREATOR_CACHE_DIR and XDG_CACHE_HOME."""
+    override = os.environ.get("SKILL_CREATOR_CACHE_DIR")
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "skill-creator" / "trigger-cache"
+
+
+def description_hash(description: str) -> str:
+    return hashlib.sha256(description.encode("utf-8")).hexdigest()
+
+
+class TriggerCache:
+    """File-per-entry cache of trigger outcomes with LRU eviction by mtime."""
+
+    def __init__(self, cache_dir: Path | None = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._writes_since_prune = 0
+
+    @staticmethod
+    def make_key(
+        skill_name: str,
+        description: str,
+        query: str,
+        model: str | None,
+        run_idx: int,
+        isolated: bool = False,
+    ) -> str:
+        payload = json.dumps(
+            [CACHE_VERSION, skill_name, description_hash(description), query, model or "", run_idx, isolated],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> bool | None:
+        """Return the cached outcome for key, or None on a miss."""
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text())
+        except (OSError, json.JSONDecodeError):
+            self.misses += 1
+            return None
+        if entry.get("version") != CACHE_VERSION or not isinstance(entry.get("triggered"), bool):
+            self.misses += 1
+            return None
+        try:
+            # Touch so eviction treats this entry as recently used
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return entry["triggered"]
+
+    def put(self, key: str, triggered: bool, skill_name: str = "") -> None:
+        path = self._path(key)
+        entry = {
+            "version": CACHE_VERSION,
+            "skill_name": skill_name,
+            "triggered": triggered,
+            "created": time.time(),
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so a concurrent reader never sees a partial file
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(entry))
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+        self._writes_since_prune += 1
+
+    def _entries(self) -> list[Path]:
+        if not self.cache_dir.is_dir():
+            return []
+        return list(self.cache_dir.glob("*/*.json"))
+
+    def prune(self) -> int:
+        """Evict least-recently-used entries beyond max_entries. Returns number removed."""
+        if self._writes_since_prune == 0:
+            return 0
+        self._writes_since_prune = 0
+        entries = self._entries()
+        excess = len(entries) - self.max_entries
+        if excess <= 0:
+            return 0
+        stamped = []
+        for path in entries:
+            try:
+                stamped.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+        stamped.sort()
+        removed = 0
+        for _, path in stamped[:excess]:
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def clear(self, skill_name: str | None = None) -> int:
+        """Remove all entries, or only those recorded for skill_name. Returns number removed."""
+        removed = 0
+        for path in self._entries():
+            if skill_name is not None:
+                try:
+                    if json.loads(path.read_text()).get("skill_name") != skill_name:
+                        continue
+                except (OSError, json.JSONDecodeError):
+                    pass
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
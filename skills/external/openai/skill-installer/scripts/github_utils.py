@@ -3,19 +3,220 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
+import tempfile
+import threading
+import time
+import urllib.error
 import urllib.request
 
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+# Unreferenced blobs younger than this may belong to another process that has
+# not indexed them yet, so they are counted but not swept.
+ORPHAN_GRACE_SECONDS = 300
 
-def github_request(url: str, user_agent: str) -> bytes:
+_index_lock = threading.Lock()
+
+
+def github_api_base() -> str:
+    return os.environ.get("SKILL_INSTALLER_API_URL", "https://api.github.com").rstrip("/")
+
+
+def codeload_base() -> str:
+    return os.environ.get("SKILL_INSTALLER_CODELOAD_URL", "https://codeload.github.com").rstrip("/")
+
+
+def _headers(user_agent: str) -> dict[str, str]:
     headers = {"User-Agent": user_agent}
     token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
     if token:
         headers["Authorization"] = f"token {token}"
-    req = urllib.request.Request(url, headers=headers)
+    return headers
+
+
+def github_request(url: str, user_agent: str) -> bytes:
+    req = urllib.request.Request(url, headers=_headers(user_agent))
     with urllib.request.urlopen(req) as resp:
         return resp.read()
 
 
 def github_api_contents_url(repo: str, path: str, ref: str) -> str:
-    return f"https://api.github.com/repos/{repo}/contents/{path}?ref={ref}"
+    return f"{github_api_base()}/repos/{repo}/contents/{path}?ref={ref}"
+
+
+def github_archive_url(owner: str, repo: str, ref: str) -> str:
+    return f"{codeload_base()}/{owner}/{repo}/zip/{ref}"
+
+
+def cache_dir() -> str:
+    override = os.environ.get("SKILL_INSTALLER_CACHE_DIR")
+    if override:
+        return override
+    codex_home = os.environ.get("CODEX_HOME", os.path.expanduser("~/.codex"))
+    return os.path.join(codex_home, "cache", "skill-installer")
+
+
+def _cache_max_bytes() -> int:
+    try:
+        return int(os.environ.get("SKILL_INSTALLER_CACHE_MAX_BYTES", DEFAULT_CACHE_MAX_BYTES))
+    except ValueError:
+        return DEFAULT_CACHE_MAX_BYTES
+
+
+def _index_path(root: str) -> str:
+    return os.path.join(root, "index.json")
+
+
+def _blob_path(root: str, digest: str) -> str:
+    return os.path.join(root, "blobs", digest[:2], digest)
+
+
+def _load_index(root: str) -> dict[str, dict]:
+    try:
+        with open(_index_path(root), encoding="utf-8") as file_handle:
+            data = json.load(file_handle)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _atomic_write(path: str, payload: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as file_handle:
+            file_handle.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _save_index(root: str, index: dict[str, dict]) -> None:
+    _atomic_write(_index_path(root), json.dumps(index, indent=2, sort_keys=True).encode("utf-8"))
+
+
+def _blob_sizes(root: str) -> dict[str, tuple[int, float]]:
+    """Map every blob on disk to its (size, mtime)."""
+    blobs: dict[str, tuple[int, float]] = {}
+    for dirpath, _, filenames in os.walk(os.path.join(root, "blobs")):
+        for name in filenames:
+            if name.startswith(".tmp-"):
+                continue
+            try:
+                info = os.stat(os.path.join(dirpath, name))
+            except OSError:
+                continue
+            blobs[name] = (info.st_size, info.st_mtime)
+    return blobs
+
+
+def _unlink_blob(root: str, digest: str) -> None:
+    try:
+        os.unlink(_blob_path(root, digest))
+    except OSError:
+        pass
+
+
+def _evict(root: str, index: dict[str, dict], max_bytes: int, keep: str) -> None:
+    """Sweep orphaned blobs, then drop least-recently-used entries (never keep)
+    until the blobs on disk fit max_bytes."""
+    blobs = _blob_sizes(root)
+    referenced = {entry["sha256"] for entry in index.values()}
+    now = time.time()
+    for digest, (_, mtime) in list(blobs.items()):
+        if digest not in referenced and now - mtime > ORPHAN_GRACE_SECONDS:
+            _unlink_blob(root, digest)
+            del blobs[digest]
+    total = sum(size for size, _ in blobs.values())
+    for url in sorted(index, key=lambda key: index[key].get("used", 0)):
+        if total <= max_bytes:
+            break
+        if url == keep:
+            continue
+        digest = index.pop(url)["sha256"]
+        if any(entry["sha256"] == digest for entry in index.values()):
+            continue
+        total -= blobs.pop(digest, (0, 0))[0]
+        _unlink_blob(root, digest)
+
+
+def github_fetch_cached(url: str, user_agent: str, fallback_dir: str) -> str:
+    """Fetch url through the local cache and return the path of its body.
+
+    Bodies are stored content-addressed by SHA-256 and indexed by URL (which
+    encodes owner/repo/ref). A cached URL is revalidated with If-None-Match, so
+    an unchanged resource costs a 304 instead of a full download. Responses
+    that cannot be cached (no ETag, or larger than the whole cache) are written
+    to fallback_dir instead.
+    """
+    root = cache_dir()
+    with _index_lock:
+        entry = _load_index(root).get(url)
+    headers = _headers(user_agent)
+    if entry and entry.get("etag") and os.path.isfile(_blob_path(root, entry["sha256"])):
+        headers["If-None-Match"] = entry["etag"]
+    else:
+        entry = None
+
+    req = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(req) as resp:
+            payload = resp.read()
+            etag = resp.headers.get("ETag")
+    except urllib.error.HTTPError as exc:
+        if exc.code != 304 or entry is None:
+            raise
+        payload = None
+        etag = entry["etag"]
+
+    max_bytes = _cache_max_bytes()
+    if payload is not None and (not etag or len(payload) > max_bytes):
+        return _write_fallback(fallback_dir, payload)
+
+    if payload is None:
+        digest = entry["sha256"]
+        size = entry.get("size", 0)
+    else:
+        digest = hashlib.sha256(payload).hexdigest()
+        size = len(payload)
+
+    with _index_lock:
+        evicted = payload is None and not os.path.isfile(_blob_path(root, digest))
+        if not evicted:
+            if payload is not None and not os.path.isfile(_blob_path(root, digest)):
+                _atomic_write(_blob_path(root, digest), payload)
+            _index_update(root, url, etag, digest, size, max_bytes)
+    if evicted:
+        # Evicted by another fetch since it was revalidated
+        return _write_fallback(fallback_dir, github_request(url, user_agent))
+    return _blob_path(root, digest)
+
+
+def _index_update(root: str, url: str, etag: str, digest: str, size: int, max_bytes: int) -> None:
+    """Point url at digest, drop its stale body if unshared, and enforce the size bound."""
+    index = _load_index(root)
+    previous = index.get(url)
+    index[url] = {"etag": etag, "sha256": digest, "size": size, "used": time.time()}
+    if previous and previous["sha256"] != digest and not any(
+        other["sha256"] == previous["sha256"] for other in index.values()
+    ):
+        # The resource changed (e.g. a branch moved); drop the stale body
+        _unlink_blob(root, previous["sha256"])
+    _evict(root, index, max_bytes, keep=url)
+    _save_index(root, index)
+
+
+def _write_fallback(fallback_dir: str, payload: bytes) -> str:
+    fallback_path = os.path.join(fallback_dir, hashlib.sha256(payload).hexdigest())
+    _atomic_write(fallback_path, payload)
+    return fallback_path
+
+
+def github_request_cached(url: str, user_agent: str) -> bytes:
+    with tempfile.TemporaryDirectory(prefix="skill-installer-") as tmp_dir:
+        with open(github_fetch_cached(url, user_agent, tmp_dir), "rb") as file_handle:
+            return file_handle.read()
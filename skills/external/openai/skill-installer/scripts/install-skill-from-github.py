@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import os
 import shutil
@@ -14,19 +15,22 @@ import urllib.error
 import urllib.parse
 import zipfile
 
-from github_utils import github_request
+from github_utils import github_archive_url, github_fetch_cached, github_request
 DEFAULT_REF = "main"
+DEFAULT_JOBS = 4
 
 
 @dataclass
 class Args:
-    url: str | None = None
+    url: list[str] | None = None
     repo: str | None = None
     path: list[str] | None = None
     ref: str = DEFAULT_REF
     dest: str | None = None
     name: str | None = None
     method: str = "auto"
+    jobs: int = DEFAULT_JOBS
+    no_cache: bool = False
 
 
 @dataclass
@@ -77,23 +81,44 @@ def _parse_github_url(url: str, default_ref: str) -> tuple[str, str, str, str |
     return owner, repo, ref, subpath or None
 
 
-def _download_repo_zip(owner: str, repo: str, ref: str, dest_dir: str) -> str:
-    zip_url = f"https://codeload.github.com/{owner}/{repo}/zip/{ref}"
+def _fetch_repo_zip(zip_url: str, dest_dir: str, use_cache: bool) -> str:
+    if use_cache:
+        # Archives are kept in a content-addressed cache and revalidated by
+        # ETag, so repeated installs from the same owner/repo/ref reuse them.
+        return github_fetch_cached(zip_url, "codex-skill-install", dest_dir)
     zip_path = os.path.join(dest_dir, "repo.zip")
+    with open(zip_path, "wb") as file_handle:
+        file_handle.write(_request(zip_url))
+    return zip_path
+
+
+def _download_repo_zip(
+    owner: str,
+    repo: str,
+    ref: str,
+    dest_dir: str,
+    paths: list[str] | None = None,
+    use_cache: bool = True,
+) -> str:
+    zip_url = github_archive_url(owner, repo, ref)
     try:
-        payload = _request(zip_url)
+        zip_path = _fetch_repo_zip(zip_url, dest_dir, use_cache)
     except urllib.error.HTTPError as exc:
         raise InstallError(f"Download failed: HTTP {exc.code}") from exc
-    with open(zip_path, "wb") as file_handle:
-        file_handle.write(payload)
     with zipfile.ZipFile(zip_path, "r") as zip_file:
-        _safe_extract_zip(zip_file, dest_dir)
-        top_levels = {name.split("/")[0] for name in zip_file.namelist() if name}
-    if not top_levels:
-        raise InstallError("Downloaded archive was empty.")
-    if len(top_levels) != 1:
-        raise InstallError("Unexpected archive layout.")
-    return os.path.join(dest_dir, next(iter(top_levels)))
+        names = zip_file.namelist()
+        top_levels = {name.split("/")[0] for name in names if name}
+        if not top_levels:
+            raise InstallError("Downloaded archive was empty.")
+        if len(top_levels) != 1:
+            raise InstallError("Unexpected archive layout.")
+        top_level = next(iter(top_levels))
+        members = None
+        if paths:
+            prefixes = [f"{top_level}/{path.strip('/')}/" for path in paths]
+            members = [name for name in names if name.startswith(tuple(prefixes))]
+        _safe_extract_zip(zip_file, dest_dir, members)
+    return os.path.join(dest_dir, top_level)
 
 
 def _run_git(args: list[str]) -> None:
@@ -102,14 +127,16 @@ def _run_git(args: list[str]) -> None:
         raise InstallError(result.stderr.strip() or "Git command failed.")
 
 
-def _safe_extract_zip(zip_file: zipfile.ZipFile, dest_dir: str) -> None:
+def _safe_extract_zip(
+    zip_file: zipfile.ZipFile, dest_dir: str, members: list[str] | None = None
+) -> None:
     dest_root = os.path.realpath(dest_dir)
-    for info in zip_file.infolist():
-        extracted_path = os.path.realpath(os.path.join(dest_dir, info.filename))
+    for name in members if members is not None else zip_file.namelist():
+        extracted_path = os.path.realpath(os.path.join(dest_dir, name))
         if extracted_path == dest_root or extracted_path.startswith(dest_root + os.sep):
             continue
         raise InstallError("Archive contains files outside the destination.")
-    zip_file.extractall(dest_dir)
+    zip_file.extractall(dest_dir, members)
 
 
 def _validate_relative_path(path: str) -> None:
@@ -184,10 +211,12 @@ def _build_repo_ssh(owner: str, repo: str) -> str:
     return f"git@github.com:{owner}/{repo}.git"
 
 
-def _prepare_repo(source: Source, method: str, tmp_dir: str) -> str:
+def _prepare_repo(source: Source, method: str, tmp_dir: str, use_cache: bool = True) -> str:
     if method in ("download", "auto"):
         try:
-            return _download_repo_zip(source.owner, source.repo, source.ref, tmp_dir)
+            return _download_repo_zip(
+                source.owner, source.repo, source.ref, tmp_dir, source.paths, use_cache
+            )
         except InstallError as exc:
             if method == "download":
                 raise
@@ -206,9 +235,9 @@ def _prepare_repo(source: Source, method: str, tmp_dir: str) -> str:
     raise InstallError("Unsupported method.")
 
 
-def _resolve_source(args: Args) -> Source:
-    if args.url:
-        owner, repo, ref, url_path = _parse_github_url(args.url, args.ref)
+def _resolve_source(args: Args, url: str | None = None) -> Source:
+    if url:
+        owner, repo, ref, url_path = _parse_github_url(url, args.ref)
         if args.path is not None:
             paths = list(args.path)
         elif url_path:
@@ -222,9 +251,7 @@ def _resolve_source(args: Args) -> Source:
     if not args.repo:
         raise InstallError("Provide --repo or --url.")
     if "://" in args.repo:
-        return _resolve_source(
-            Args(url=args.repo, repo=None, path=args.path, ref=args.ref)
-        )
+        return _resolve_source(args, url=args.repo)
 
     repo_parts = [p for p in args.repo.split("/") if p]
     if len(repo_parts) != 2:
@@ -240,6 +267,50 @@ def _resolve_source(args: Args) -> Source:
     )
 
 
+def _resolve_sources(args: Args) -> list[Source]:
+    """Resolve every --url (or the single --repo) into sources.
+
+    Sources sharing owner/repo/ref are merged so their archive is fetched and
+    extracted once.
+    """
+    urls = args.url or []
+    if len(urls) > 1 and args.path is not None:
+        raise InstallError("--path cannot be combined with multiple --url values.")
+    if urls:
+        resolved = [_resolve_source(args, url) for url in urls]
+    else:
+        resolved = [_resolve_source(args)]
+    merged: dict[tuple[str, str, str], Source] = {}
+    for source in resolved:
+        source.ref = source.ref or args.ref
+        key = (source.owner, source.repo, source.ref)
+        if key not in merged:
+            merged[key] = source
+            continue
+        for path in source.paths:
+            if path not in merged[key].paths:
+                merged[key].paths.append(path)
+    return list(merged.values())
+
+
+def _install_source(
+    source: Source, targets: list[tuple[str, str, str]], method: str, use_cache: bool
+) -> list[tuple[str, str]]:
+    tmp_dir = tempfile.mkdtemp(prefix="skill-install-", dir=_tmp_root())
+    try:
+        repo_root = _prepare_repo(source, method, tmp_dir, use_cache)
+        installed = []
+        for path, skill_name, dest_dir in targets:
+            skill_src = os.path.join(repo_root, path)
+            _validate_skill(skill_src)
+            _copy_skill(skill_src, dest_dir)
+            installed.append((skill_name, dest_dir))
+        return installed
+    finally:
+        if os.path.isdir(tmp_dir):
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
 def _default_dest() -> str:
     return os.path.join(_codex_home(), "skills")
 
@@ -247,7 +318,12 @@ def _default_dest() -> str:
 def _parse_args(argv: list[str]) -> Args:
     parser = argparse.ArgumentParser(description="Install a skill from GitHub.")
     parser.add_argument("--repo", help="owner/repo")
-    parser.add_argument("--url", help="https://github.com/owner/repo[/tree/ref/path]")
+    parser.add_argument(
+        "--url",
+        nargs="+",
+        action="extend",
+        help="https://github.com/owner/repo[/tree/ref/path] (repeatable)",
+    )
     parser.add_argument(
         "--path",
         nargs="+",
@@ -263,46 +339,68 @@ def _parse_args(argv: list[str]) -> Args:
         choices=["auto", "download", "git"],
         default="auto",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help="Repos to fetch and install concurrently",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always download archives instead of reusing the local cache",
+    )
     return parser.parse_args(argv, namespace=Args())
 
 
 def main(argv: list[str]) -> int:
     args = _parse_args(argv)
     try:
-        source = _resolve_source(args)
-        source.ref = source.ref or args.ref
-        if not source.paths:
+        sources = _resolve_sources(args)
+        total_paths = sum(len(source.paths) for source in sources)
+        if not total_paths:
             raise InstallError("No skill paths provided.")
-        for path in source.paths:
-            _validate_relative_path(path)
         dest_root = args.dest or _default_dest()
-        tmp_dir = tempfile.mkdtemp(prefix="skill-install-", dir=_tmp_root())
-        try:
-            repo_root = _prepare_repo(source, args.method, tmp_dir)
-            installed = []
+        plan: list[tuple[Source, list[tuple[str, str, str]]]] = []
+        seen: set[str] = set()
+        for source in sources:
+            targets = []
             for path in source.paths:
-                skill_name = args.name if len(source.paths) == 1 else None
+                _validate_relative_path(path)
+                skill_name = args.name if total_paths == 1 else None
                 skill_name = skill_name or os.path.basename(path.rstrip("/"))
                 _validate_skill_name(skill_name)
                 if not skill_name:
                     raise InstallError("Unable to derive skill name.")
+                if skill_name in seen:
+                    raise InstallError(f"Skill name requested twice: {skill_name}")
+                seen.add(skill_name)
                 dest_dir = os.path.join(dest_root, skill_name)
                 if os.path.exists(dest_dir):
                     raise InstallError(f"Destination already exists: {dest_dir}")
-                skill_src = os.path.join(repo_root, path)
-                _validate_skill(skill_src)
-                _copy_skill(skill_src, dest_dir)
-                installed.append((skill_name, dest_dir))
-        finally:
-            if os.path.isdir(tmp_dir):
-                shutil.rmtree(tmp_dir, ignore_errors=True)
-        for skill_name, dest_dir in installed:
-            print(f"Installed {skill_name} to {dest_dir}")
-        return 0
+                targets.append((path, skill_name, dest_dir))
+            plan.append((source, targets))
     except InstallError as exc:
         print(f"Error: {exc}", file=sys.stderr)
         return 1
 
+    failed = False
+    with ThreadPoolExecutor(max_workers=max(1, min(args.jobs, len(plan)))) as pool:
+        futures = [
+            pool.submit(_install_source, source, targets, args.method, not args.no_cache)
+            for source, targets in plan
+        ]
+        for (source, _), future in zip(plan, futures):
+            try:
+                installed = future.result()
+            except InstallError as exc:
+                failed = True
+                print(f"Error ({source.owner}/{source.repo}@{source.ref}): {exc}", file=sys.stderr)
+                continue
+            for skill_name, dest_dir in installed:
+                print(f"Installed {skill_name} to {dest_dir}")
+    return 1 if failed else 0
+
 
 if __name__ == "__main__":
     raise SystemExit(main(sys.argv[1:]))
@@ -9,7 +9,7 @@ import os
 import sys
 import urllib.error
 
-from github_utils import github_api_contents_url, github_request
+from github_utils import github_api_contents_url, github_request, github_request_cached
 
 DEFAULT_REPO = "openai/skills"
 DEFAULT_PATH = "skills/.curated"
@@ -25,9 +25,14 @@ class Args(argparse.Namespace):
     path: str
     ref: str
     format: str
+    no_cache: bool
 
 
-def _request(url: str) -> bytes:
+def _request(url: str, use_cache: bool = True) -> bytes:
+    if use_cache:
+        # Revalidated with If-None-Match; a 304 does not count against the
+        # GitHub API rate limit.
+        return github_request_cached(url, "codex-skill-list")
     return github_request(url, "codex-skill-list")
 
 
@@ -47,10 +52,10 @@ def _installed_skills() -> set[str]:
     return entries
 
 
-def _list_skills(repo: str, path: str, ref: str) -> list[str]:
+def _list_skills(repo: str, path: str, ref: str, use_cache: bool = True) -> list[str]:
     api_url = github_api_contents_url(repo, path, ref)
     try:
-        payload = _request(api_url)
+        payload = _request(api_url, use_cache)
     except urllib.error.HTTPError as exc:
         if exc.code == 404:
             raise ListError(
@@ -80,13 +85,18 @@ def _parse_args(argv: list[str]) -> Args:
         default="text",
         help="Output format",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Skip the local response cache",
+    )
     return parser.parse_args(argv, namespace=Args())
 
 
 def main(argv: list[str]) -> int:
     args = _parse_args(argv)
     try:
-        skills = _list_skills(args.repo, args.path, args.ref)
+        skills = _list_skills(args.repo, args.path, args.ref, not args.no_cache)
         installed = _installed_skills()
         if args.format == "json":
             payload = [